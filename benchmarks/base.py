@@ -0,0 +1,97 @@
+"""
+Shared setup for the benchmark scripts.
+
+The scripts run against an in-memory SQLite database and the local-memory cache,
+so the numbers show the relative costs of the code paths rather than network latency.
+The number of cache round trips is counted too, as those dominate with memcached.
+"""
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.realpath(__file__))))
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DEBUG = False,
+        DATABASES = {
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:'
+            }
+        },
+        CACHES = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'OPTIONS': {'MAX_ENTRIES': 100000},
+            }
+        },
+        INSTALLED_APPS = (
+            'django.contrib.contenttypes',
+            'django.contrib.sites',
+            'parler',
+            'parler.tests.testapp',
+        ),
+        SITE_ID = 4,
+        LANGUAGE_CODE = 'en',
+        PARLER_LANGUAGES = {
+            4: (
+                {'code': 'nl'},
+                {'code': 'de'},
+                {'code': 'en'},
+            ),
+            'default': {
+                'fallback': 'en',
+            },
+        },
+    )
+
+
+class CountingCache(object):
+    """
+    Proxy for the cache backend, which counts the round trips.
+    """
+    def __init__(self, backend):
+        self.backend = backend
+        self.calls = 0
+
+    def __getattr__(self, name):
+        method = getattr(self.backend, name)
+        if not callable(method):
+            return method
+
+        def _counted(*args, **kwargs):
+            self.calls += 1
+            return method(*args, **kwargs)
+        return _counted
+
+
+def setup():
+    """
+    Create the database tables, and install the counting cache proxy.
+    """
+    from django.core.management import call_command
+    from parler import cache as parler_cache
+    call_command('syncdb', verbosity=0, interactive=False)
+
+    if not isinstance(parler_cache.cache, CountingCache):
+        parler_cache.cache = CountingCache(parler_cache.cache)
+    return parler_cache.cache
+
+
+def measure(title, func, repeat=5):
+    """
+    Run the function a few times, and report the best time and the number of cache round trips.
+    """
+    from parler import cache as parler_cache
+    counter = parler_cache.cache
+    timings = []
+    for i in range(repeat):
+        counter.calls = 0
+        start = time.time()
+        func()
+        timings.append(time.time() - start)
+
+    print "{0:<50} {1:>9.2f} ms {2:>6} cache calls".format(title, min(timings) * 1000, counter.calls)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Compare the per-language cache layout with the bundle layout (``PARLER_CACHE_BUNDLE = True``).
+
+Each page renders objects in a language which is only partially translated,
+so half of the objects need the fallback language.
+"""
+import base
+
+NUM_OBJECTS = 200
+
+
+def main():
+    base.setup()
+    from django.core.cache import cache
+    from parler import appsettings
+    from parler.tests.testapp.models import SimpleModel
+
+    for i in range(NUM_OBJECTS):
+        x = SimpleModel(tr_title='TITLE_EN_{0}'.format(i), _current_language='en')
+        if i % 2:
+            x.set_current_language('nl')
+            x.tr_title = 'TITLE_NL_{0}'.format(i)
+        x.save()
+
+    def render_titles():
+        for x in SimpleModel.objects.language('nl'):
+            x.tr_title
+
+    def render_language_tabs():
+        for x in SimpleModel.objects.language('nl'):
+            x.tr_title
+            x.get_available_languages()
+
+    for bundle in (False, True):
+        appsettings.PARLER_CACHE_BUNDLE = bundle
+        cache.clear()
+        render_language_tabs()  # warm up
+
+        layout = 'bundle' if bundle else 'per language'
+        print "{0} objects, {1} layout:".format(NUM_OBJECTS, layout)
+        base.measure("  title with fallback", render_titles)
+        base.measure("  title with fallback + available languages", render_language_tabs)
+
+
+if __name__ == '__main__':
+    main()
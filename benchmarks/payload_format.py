@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Compare the size and decoding time of the cached translation values.
+
+The dictionary format stores the field names in every entry,
+the tuple format stores the values in a fixed field order.
+"""
+import base
+import cPickle as pickle
+import time
+
+NUM_ENTRIES = 1000
+
+
+def main():
+    base.setup()
+    from parler.cache import _get_cache_values, _create_translation
+    from parler.tests.testapp.models import SimpleModel
+
+    x = SimpleModel(tr_title='Title of the object', _current_language='en')
+    x.save()
+    translation = x._get_translated_model()
+
+    def dict_values(translation):
+        values = {'id': translation.id}
+        for name in translation.get_translated_fields():
+            values[name] = getattr(translation, name)
+        return values
+
+    def dict_create(values):
+        return x._translations_model(**dict(values, master=x, language_code='en'))
+
+    formats = (
+        ('dict', dict_values(translation), dict_create),
+        ('tuple', _get_cache_values(translation), lambda values: _create_translation(x, 'en', values)),
+    )
+
+    for protocol in (0, pickle.HIGHEST_PROTOCOL):
+        print "Pickle protocol {0}:".format(protocol)
+        for name, values, create in formats:
+            data = pickle.dumps(values, protocol)
+            start = time.time()
+            for i in xrange(NUM_ENTRIES):
+                pickle.loads(data)
+            loads = time.time() - start
+
+            start = time.time()
+            for i in xrange(NUM_ENTRIES):
+                create(pickle.loads(data))
+            total = time.time() - start
+
+            print "  {0:<6} {1:>4} bytes per entry, {2} decodes: {3:>6.2f} ms unpickling, {4:>6.2f} ms including the model".format(
+                name, len(data), NUM_ENTRIES, loads * 1000, total * 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Compare the filter of ``translated()`` with several languages.
+
+The join filter returns each object once per matching language, which needs a DISTINCT,
+the subquery filter returns each object only once.
+"""
+import base
+
+NUM_OBJECTS = 50000
+PAGE_SIZE = 20
+
+
+def main():
+    base.setup()
+    from parler.tests.testapp.models import SimpleModel
+
+    # Most objects are translated in several languages.
+    SimpleModel.objects.bulk_create([SimpleModel(id=i + 1) for i in xrange(NUM_OBJECTS)])
+    translations = []
+    for i in xrange(NUM_OBJECTS):
+        for language_code in ('en', 'nl', 'de')[:i % 3 + 1]:
+            translations.append(SimpleModel._translations_model(master_id=i + 1, language_code=language_code, tr_title='Title {0}'.format(i)))
+    SimpleModel._translations_model.objects.bulk_create(translations)
+
+    language_codes = ('nl', 'en')
+    distinct_qs = SimpleModel.objects.filter(translations__language_code__in=language_codes).distinct().order_by('pk')
+    subquery_qs = SimpleModel.objects.translated(*language_codes).order_by('pk')
+    assert distinct_qs.count() == subquery_qs.count() == NUM_OBJECTS
+
+    print "{0} objects, {1} translations:".format(NUM_OBJECTS, len(translations))
+    for title, qs in (('join + DISTINCT', distinct_qs), ('subquery', subquery_qs)):
+        base.measure("  {0}: count()".format(title), lambda: qs.count())
+        base.measure("  {0}: first page".format(title), lambda: list(qs[:PAGE_SIZE]))
+        base.measure("  {0}: last page".format(title), lambda: list(qs[NUM_OBJECTS - PAGE_SIZE:]))
+
+
+if __name__ == '__main__':
+    main()
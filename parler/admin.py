@@ -169,12 +169,12 @@ class TranslatableAdmin(BaseTranslatableAdmin, admin.ModelAdmin):
 
     def get_available_languages(self, obj):
         """
-        Fetching the available languages as queryset.
+        Fetching the available languages as list.
         """
         if obj:
             return obj.get_available_languages()
         else:
-            return self.model._translations_model.objects.get_empty_query_set()
+            return []
 
 
     def get_object(self, request, object_id):
@@ -339,7 +339,7 @@ class TranslatableAdmin(BaseTranslatableAdmin, admin.ModelAdmin):
         if not self.has_delete_permission(request, translation):
             raise PermissionDenied
 
-        if self.get_available_languages(translation.master).count() <= 1:
+        if len(self.get_available_languages(translation.master)) <= 1:
             return self.deletion_not_allowed(request, translation, language_code)
 
         # Populate deleted_objects, a data structure of all related objects that
@@ -14,6 +14,42 @@ PARLER_LANGUAGES = getattr(settings, 'PARLER_LANGUAGES', {})
 
 PARLER_ENABLE_CACHING = getattr(settings, 'PARLER_ENABLE_CACHING', True)
 
+PARLER_CACHE_TIMEOUT = getattr(settings, 'PARLER_CACHE_TIMEOUT', None)  # How long translations are cached (in seconds), None uses the timeout of the cache backend.
+
+PARLER_CACHE_BUNDLE = getattr(settings, 'PARLER_CACHE_BUNDLE', False)  # Store all languages of an object in a single cache key.
+
+PARLER_CACHE_GENERATION_INTERVAL = getattr(settings, 'PARLER_CACHE_GENERATION_INTERVAL', 10)  # How often to check whether the model cache was invalidated, in seconds.
+
+PARLER_LOCAL_CACHE_MAX_ENTRIES = getattr(settings, 'PARLER_LOCAL_CACHE_MAX_ENTRIES', 0)  # Size of the in-process cache, 0 disables it.
+
+PARLER_LOCAL_CACHE_MAX_BYTES = getattr(settings, 'PARLER_LOCAL_CACHE_MAX_BYTES', 10 * 1024 * 1024)  # Estimated memory limit of the in-process cache.
+
+PARLER_LOCAL_CACHE_TIMEOUT = getattr(settings, 'PARLER_LOCAL_CACHE_TIMEOUT', 60)  # How long the in-process cache keeps entries, in seconds.
+
+PARLER_CACHE_COMPRESS_MIN_SIZE = getattr(settings, 'PARLER_CACHE_COMPRESS_MIN_SIZE', 4096)  # Compress cached translations larger than this (in bytes), 0 disables it.
+
+PARLER_CACHE_LOCK_TIMEOUT = getattr(settings, 'PARLER_CACHE_LOCK_TIMEOUT', 0)  # Let one process fill a missing cache entry while others wait, 0 disables it.
+
+PARLER_CACHE_LOCK_WAIT = getattr(settings, 'PARLER_CACHE_LOCK_WAIT', 0.5)  # How long to wait for another process to fill the cache, in seconds.
+
+PARLER_CACHE_EARLY_REFRESH = getattr(settings, 'PARLER_CACHE_EARLY_REFRESH', 0)  # Time window (in seconds) for refreshing entries before they expire, 0 disables it.
+
+PARLER_CACHE_WRITE_BEHIND_THREADS = getattr(settings, 'PARLER_CACHE_WRITE_BEHIND_THREADS', 0)  # Threads which fill the cache after a read miss, 0 fills it directly.
+
+PARLER_CACHE_WRITE_BEHIND_QUEUE_SIZE = getattr(settings, 'PARLER_CACHE_WRITE_BEHIND_QUEUE_SIZE', 1000)  # Maximum number of pending entries, others are dropped.
+
+PARLER_CACHE_BREAKER_THRESHOLD = getattr(settings, 'PARLER_CACHE_BREAKER_THRESHOLD', 0)  # Slow or failing cache calls before the cache is skipped, 0 disables it.
+
+PARLER_CACHE_LATENCY_BUDGET = getattr(settings, 'PARLER_CACHE_LATENCY_BUDGET', 0.1)  # Cache calls taking longer than this (in seconds) are slow.
+
+PARLER_CACHE_BREAKER_COOLDOWN = getattr(settings, 'PARLER_CACHE_BREAKER_COOLDOWN', 30)  # How long the cache is skipped, in seconds.
+
+PARLER_CACHE_MISSING_TIMEOUT = getattr(settings, 'PARLER_CACHE_MISSING_TIMEOUT', 600)  # How long to remember missing translations, 0 disables this.
+
+PARLER_VALUES_CHUNK_SIZE = getattr(settings, 'PARLER_VALUES_CHUNK_SIZE', 2000)  # Rows per query of translated_values(), for querysets without an ordering.
+
+PARLER_AUTO_BATCH = getattr(settings, 'PARLER_AUTO_BATCH', False)  # Link the objects of each result set, see TranslatableQuerySet.batch_translations().
+
 
 def add_default_language_settings(languages_list, var_name='PARLER_LANGUAGES', **extra_defaults):
     """
@@ -32,7 +68,7 @@ def add_default_language_settings(languages_list, var_name='PARLER_LANGUAGES', *
         # Apply the defaults to the languages
         MYAPP_LANGUAGES = parler_appsettings.add_default_language_settings(MYAPP_LANGUAGES, 'MYAPP_LANGUAGES',
             code=MYAPP_DEFAULT_LANGUAGE_CODE,
-            fallback=MYAPP_DEFAULT_LANGUAGE_CODE,
+            fallbacks=[MYAPP_DEFAULT_LANGUAGE_CODE],
             hide_untranslated=False
         )
 
@@ -44,9 +80,11 @@ def add_default_language_settings(languages_list, var_name='PARLER_LANGUAGES', *
     languages_list.setdefault('default', {})
     defaults = languages_list['default']
     defaults.setdefault('code', PARLER_DEFAULT_LANGUAGE_CODE)
-    defaults.setdefault('fallback', PARLER_DEFAULT_LANGUAGE_CODE)
     defaults.setdefault('hide_untranslated', False)   # Whether queries with .active_translations() may or may not return the fallback language.
+    if 'fallback' in extra_defaults and 'fallbacks' not in extra_defaults:
+        defaults.pop('fallbacks', None)
     defaults.update(extra_defaults)  # Also allow to override code and fallback this way.
+    _set_fallbacks(defaults, (PARLER_DEFAULT_LANGUAGE_CODE,))
 
     if not is_supported_django_language(defaults['code']):
         raise ImproperlyConfigured("The value for {0}['defaults']['code'] ('{1}') does not exist in LANGUAGES".format(var_name, defaults['code']))
@@ -62,12 +100,33 @@ def add_default_language_settings(languages_list, var_name='PARLER_LANGUAGES', *
                 raise ImproperlyConfigured("{0}[{1}][{2}]['code'] does not exist in LANGUAGES".format(var_name, site_id, i))
 
             # Copy all items from the defaults, so you can provide new fields too.
+            _set_fallbacks(choice, defaults['fallbacks'])
             for key, value in defaults.iteritems():
                 choice.setdefault(key, value)
 
     return languages_list
 
 
+def _set_fallbacks(lang_dict, default_fallbacks):
+    """
+    Make sure both the ``fallback`` and ``fallbacks`` values are set.
+    The ``fallbacks`` list defines the chain of languages to try, e.g. ``['fr', 'en']`` for ``fr-ca``.
+    The ``fallback`` value is the first language of that chain.
+    """
+    if 'fallbacks' in lang_dict:
+        fallbacks = list(lang_dict['fallbacks'])
+    elif 'fallback' in lang_dict:
+        fallbacks = [lang_dict['fallback']]
+    else:
+        fallbacks = list(default_fallbacks)
+
+    if not fallbacks:
+        raise ImproperlyConfigured("The 'fallbacks' setting of language '{0}' should contain at least one language.".format(lang_dict.get('code')))
+
+    lang_dict['fallbacks'] = fallbacks
+    lang_dict['fallback'] = fallbacks[0]
+
+
 # Clean settings
 PARLER_DEFAULT_LANGUAGE_CODE = normalize_language_code(PARLER_DEFAULT_LANGUAGE_CODE)
 PARLER_LANGUAGES = add_default_language_settings(PARLER_LANGUAGES)
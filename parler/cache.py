@@ -1,15 +1,81 @@
+from contextlib import contextmanager
 from django.core.cache import cache
+from django.dispatch import receiver
 from parler import appsettings
+from parler.signals import post_translation_save, post_translation_delete
+import cPickle as pickle
+import hashlib
+import logging
+import math
+import os
+import random
+import threading
+import time
+import zlib
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from django.utils.datastructures import SortedDict as OrderedDict  # Python 2.6
+
+logger = logging.getLogger(__name__)
+
+# The value stored for translations which don't exist.
+# This avoids querying the database again for the same missing translation.
+MISSING_MARKER = {'__missing__': True}
+
+# The generation of each translations model, as (generation, expire time).
+_generations = {}
+
+# The request-scoped cache, enabled by the RequestCacheMiddleware.
+_request_cache = threading.local()
+_ABSENT = object()
+
+# The queued cache writes, see batch_cache_writes().
+_write_queue = threading.local()
+_DELETED = object()
+
+# The refill locks which are held by the current thread, see _refill_lock().
+_held_locks = threading.local()
+
+# The last known version of each translations model, to detect changes in other processes.
+_local_versions = {}
+
+# The first item of compressed cache values.
+_COMPRESSED_MARKER = '__zlib__'
+
+# The first item of cache values which contain their expire time, for early refreshing.
+_REFRESH_MARKER = '__refresh__'
+
+# The value which replaces an invalidated list of languages for a while.
+# This stops readers which fetched the list before the change from storing their outdated list again.
+_INVALIDATED_MARKER = '__invalidated__'
+_INVALIDATED_TIMEOUT = 30
+
+# The write-behind threads compress values too, so the counters are updated with a lock.
+_compression_lock = threading.Lock()
+_compression_stats = {
+    'compressed': 0,
+    'original_bytes': 0,
+    'compressed_bytes': 0,
+    'decompressed': 0,
+    'decompress_time': 0.0,
+}
 
 
 def get_object_cache_keys(instance):
     """
     Return the cache keys associated with an object.
     """
-    keys = []
-    # TODO: performs a query to fetch the language codes. Store that in memcached too.
-    for language in instance.get_available_languages():
+    keys = [
+        get_available_languages_cache_key(instance._translations_model, instance.pk),
+        get_translation_bundle_cache_key(instance._translations_model, instance.pk),
+        get_object_cache_key(instance._translations_model, instance.pk),
+    ]
+    for language in instance.get_available_languages():  # read from the cache too.
         keys.append(get_translation_cache_key(instance._translations_model, instance.pk, language))
+        for attname in instance._translations_model.get_heavy_field_attnames():
+            keys.append(get_translated_field_cache_key(instance._translations_model, instance.pk, language, attname))
 
     return keys
 
@@ -20,7 +86,910 @@ def get_translation_cache_key(translated_model, master_id, language_code):
     """
     # Always cache the entire object, as this already produces
     # a lot of queries. Don't go for caching individual fields.
-    return 'parler.{0}.{1}.{2}'.format(translated_model.__name__, long(master_id), language_code)
+    return '{0}.{1}.{2}'.format(_get_key_prefix(translated_model), long(master_id), language_code)
+
+
+def get_translated_field_cache_key(translated_model, master_id, language_code, field_name):
+    """
+    The low-level function to get the cache key for a heavy field of a translation.
+    """
+    return '{0}.{1}.{2}.{3}'.format(_get_key_prefix(translated_model), long(master_id), language_code, field_name)
+
+
+def get_object_cache_key(translated_model, master_id):
+    """
+    The low-level function to get the cache key for an object with its translations.
+    This key is used by ``TranslatableManager.cached_get()``.
+    """
+    return '{0}.{1}.object'.format(_get_key_prefix(translated_model), long(master_id))
+
+
+def get_available_languages_cache_key(translated_model, master_id):
+    """
+    The low-level function to get the cache key for the available languages of an object.
+    """
+    return '{0}.{1}.languages'.format(_get_key_prefix(translated_model), long(master_id))
+
+
+def get_translation_bundle_cache_key(translated_model, master_id):
+    """
+    The low-level function to get the cache key for all translations of an object.
+    This key is used when ``PARLER_CACHE_BUNDLE = True`` is set.
+    """
+    return '{0}.{1}'.format(_get_key_prefix(translated_model), long(master_id))
+
+
+def _get_key_prefix(translated_model):
+    # The generation and field layout are part of the key,
+    # so changing either one makes all previous entries unreachable.
+    return '{0}{1}.{2}'.format(_get_model_key_prefix(translated_model), get_cache_generation(translated_model), _get_schema_hash(translated_model))
+
+
+def _get_schema_hash(translated_model):
+    # A short hash of the cache format and translated fields, calculated once per model.
+    try:
+        return translated_model.__dict__['_parler_schema_hash']
+    except KeyError:
+        schema = '{0}:{1}:{2}'.format(_CACHE_FORMAT, ','.join(_get_cache_fields(translated_model)), ','.join(translated_model.heavy_fields))
+        translated_model._parler_schema_hash = hashlib.md5(schema).hexdigest()[:8]
+        return translated_model._parler_schema_hash
+
+
+def _get_cache_fields(translated_model):
+    # The attribute names of the translated fields, in the order of the cached values.
+    # The heavy fields are cached separately.
+    try:
+        return translated_model.__dict__['_parler_cache_fields']
+    except KeyError:
+        meta = translated_model._meta
+        translated_model._parler_cache_fields = tuple(
+            meta.get_field(name).attname for name in translated_model.get_translated_fields() if name not in translated_model.heavy_fields
+        )
+        return translated_model._parler_cache_fields
+
+
+# The version of the cached values layout, which is part of the schema hash.
+# Version 3 compresses complete cache entries, instead of the values inside bundles.
+_CACHE_FORMAT = 3
+
+
+def get_cache_generation(translated_model):
+    """
+    Return the current cache generation of a translations model.
+
+    The value is read from the cache at most once per ``PARLER_CACHE_GENERATION_INTERVAL`` seconds.
+    """
+    now = time.time()
+    try:
+        generation, expires = _generations[translated_model]
+        if expires > now:
+            return generation
+    except KeyError:
+        pass
+
+    if _breaker.is_open():
+        # The cache is not used, keep the previous value until it can be checked again.
+        return _generations.get(translated_model, (0,))[0]
+
+    key = _get_generation_cache_key(translated_model)
+    if appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+        # Check whether other processes changed translations, in the same cache query.
+        version_key = _get_version_cache_key(translated_model)
+        values = _breaker.call(cache.get_many, {}, [key, version_key])
+        generation = values.get(key)
+        _check_local_version(translated_model, values.get(version_key, 0))
+    else:
+        generation = _breaker.call(cache.get, None, key)
+
+    if generation is None:
+        # Start with a unique value, so an evicted counter doesn't make old entries reachable again.
+        generation = _new_generation()
+        if not _breaker.call(cache.add, True, key, generation, timeout=_GENERATION_TIMEOUT):
+            generation = _breaker.call(cache.get, generation, key, generation)
+
+    if not _breaker.is_open():
+        _generations[translated_model] = (generation, now + appsettings.PARLER_CACHE_GENERATION_INTERVAL)
+    return generation
+
+
+def bump_cache_generation(model):
+    """
+    Invalidate all cached translations of a model at once.
+
+    This increments the cache generation of the model, which makes all previous cache entries unreachable.
+    Other processes notice the change within ``PARLER_CACHE_GENERATION_INTERVAL`` seconds.
+
+    :param model: The translations model, or the shared model.
+    """
+    translated_model = getattr(model, '_translations_model', None) or model
+    key = _get_generation_cache_key(translated_model)
+    current = _generations.get(translated_model, (0,))[0]
+    generation = _breaker.call(_increment_counter, None, key, current + 1)
+    if generation is None:
+        # The cache backend is skipped or failed. Only this process uses the new generation,
+        # the other processes are invalidated when the backend recovers.
+        _breaker.add_skipped_keys([key])
+        generation = max(_new_generation(), current + 1)
+
+    _generations[translated_model] = (generation, time.time() + appsettings.PARLER_CACHE_GENERATION_INTERVAL)
+    _local_cache.delete_prefix(_get_model_key_prefix(translated_model))
+    return generation
+
+
+def _new_generation():
+    return int(time.time() * 1000)
+
+
+def _increment_counter(key, minimum=0):
+    # Increment a counter in the cache.
+    # When the counter doesn't exist (anymore), start a new unique value.
+    try:
+        return cache.incr(key)
+    except ValueError:
+        value = max(_new_generation(), minimum)
+        cache.set(key, value, timeout=_GENERATION_TIMEOUT)
+        return value
+
+
+def _get_generation_cache_key(translated_model):
+    return 'parler.{0}.generation'.format(translated_model.__name__)
+
+
+def _get_version_cache_key(translated_model):
+    return 'parler.{0}.version'.format(translated_model.__name__)
+
+
+def _get_changes_cache_key(translated_model, version):
+    return 'parler.{0}.changes.{1}'.format(translated_model.__name__, version)
+
+
+def _get_model_key_prefix(translated_model):
+    return 'parler.{0}.'.format(translated_model.__name__)
+
+
+# Keep the generation for 30 days, which is the longest relative timeout memcached supports.
+_GENERATION_TIMEOUT = 60 * 60 * 24 * 30
+
+
+def enable_request_cache():
+    """
+    Start a request-scoped cache for the current thread.
+
+    Cache entries which are read or written are remembered in memory until :func:`disable_request_cache` is called,
+    so repeated lookups of the same translation don't query the cache backend again.
+    This is done by the :class:`~parler.middleware.RequestCacheMiddleware`.
+    """
+    _request_cache.data = {}
+    _request_cache.hits = 0
+    _request_cache.misses = 0
+
+
+def disable_request_cache():
+    """
+    End the request-scoped cache of the current thread.
+    The statistics remain available until the next :func:`enable_request_cache` call.
+    """
+    _request_cache.data = None
+
+
+def get_request_cache_stats():
+    """
+    Return the statistics of the request-scoped cache, as dictionary with ``hits`` and ``misses``.
+    """
+    return {
+        'hits': getattr(_request_cache, 'hits', 0),
+        'misses': getattr(_request_cache, 'misses', 0),
+    }
+
+
+def start_cache_writes():
+    """
+    Start queueing the cache writes and deletes of the current thread.
+
+    The queued changes are sent to the cache backend by :func:`flush_cache_writes`,
+    using a single ``set_many()`` and ``delete_many()`` call.
+    This is done by the :class:`~parler.middleware.BatchCacheWritesMiddleware` and :func:`batch_cache_writes`.
+
+    A queue which is left over from a previous request (e.g. when the response was never returned)
+    is discarded, so it can't be sent at the end of an unrelated request.
+    """
+    if getattr(_write_queue, 'data', None) is not None:
+        discard_cache_writes()
+    _write_queue.data = {}
+    _write_queue.changed = {}
+
+
+def flush_cache_writes():
+    """
+    Send the queued cache writes and deletes to the cache backend, and stop queueing.
+    """
+    queue = getattr(_write_queue, 'data', None)
+    changed = getattr(_write_queue, 'changed', None)
+    _write_queue.data = None
+    _write_queue.changed = None
+    if not queue:
+        return
+
+    updates = {}
+    deletes = []
+    for key, (value, timeout) in queue.iteritems():
+        if value is _DELETED:
+            deletes.append(key)
+        else:
+            updates.setdefault(timeout, {})[key] = value
+
+    if deletes:
+        _backend_delete_many(deletes)
+    for timeout, data in updates.iteritems():
+        _backend_set_many(data, timeout=timeout)
+
+    # Let other processes know about the changes, after the new values are stored.
+    for translated_model, master_ids in (changed or {}).iteritems():
+        _publish_local_changes(translated_model, master_ids)
+
+
+def discard_cache_writes():
+    """
+    Drop the queued cache writes, e.g. because the transaction is rolled back.
+
+    The affected keys are deleted, as the cache could also contain values which are changed in the database.
+    """
+    queue = getattr(_write_queue, 'data', None)
+    _write_queue.data = None
+    _write_queue.changed = None   # The values of other processes are not changed.
+    if queue:
+        _backend_delete_many(queue.keys())
+        request_data = getattr(_request_cache, 'data', None)
+        if request_data is not None:
+            for key in queue:
+                request_data.pop(key, None)
+
+
+@contextmanager
+def batch_cache_writes():
+    """
+    Queue the cache writes and deletes in the block, and send them at the end.
+
+    When the block raises an exception, the queued values are not stored.
+    Wrap this around ``transaction.commit_on_success()``, so the cache is only updated after the commit::
+
+        with batch_cache_writes():
+            with transaction.commit_on_success():
+                ...
+    """
+    if getattr(_write_queue, 'data', None) is not None:
+        # Nested block, the outer block sends the changes.
+        yield
+        return
+
+    start_cache_writes()
+    try:
+        yield
+    except:
+        discard_cache_writes()
+        raise
+    else:
+        flush_cache_writes()
+
+
+def _cache_get(key):
+    if getattr(_request_cache, 'data', None) is None and getattr(_write_queue, 'data', None) is None and not appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+        return _decompress_value(_breaker.call(cache.get, None, key))
+    return _cache_get_many([key]).get(key)
+
+
+def _cache_get_many(keys):
+    # Read the queued writes first, so the changes of this thread are visible.
+    queue = getattr(_write_queue, 'data', None)
+    if queue:
+        queued = [key for key in keys if key in queue]
+        if queued:
+            result = _cache_get_many([key for key in keys if key not in queue]) if len(queued) < len(keys) else {}
+            for key in queued:
+                if queue[key][0] is not _DELETED:
+                    result[key] = queue[key][0]
+            return result
+
+    # Read the keys from the request cache first, and the remaining keys from the cache backend.
+    data = getattr(_request_cache, 'data', None)
+    if data is None:
+        return _backend_get_many(keys)
+
+    result = {}
+    remaining = []
+    for key in keys:
+        value = data.get(key)
+        if value is None:
+            remaining.append(key)
+        elif value is not _ABSENT:
+            result[key] = value
+
+    _request_cache.hits += len(keys) - len(remaining)
+    _request_cache.misses += len(remaining)
+    if remaining:
+        found = _backend_get_many(remaining)
+        for key in remaining:
+            data[key] = found.get(key, _ABSENT)  # also remember keys that don't exist.
+        result.update(found)
+
+    return result
+
+
+def _backend_get_many(keys):
+    # Read the keys from the local cache first, and the remaining keys from the cache backend.
+    # The local cache stores the decompressed values, so local hits don't decompress again.
+    if not appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+        return _decompress_data(_breaker.call(cache.get_many, {}, keys))
+
+    result = _local_cache.get_many(keys)
+    if len(result) < len(keys):
+        found = _decompress_data(_breaker.call(cache.get_many, {}, [key for key in keys if key not in result]))
+        _local_cache.set_many(found)
+        result.update(found)
+    return result
+
+
+def _cache_set_many(data, timeout=None, background=False):
+    # Values which are fetched after a read miss can be stored by the background threads.
+    if timeout is None:
+        timeout = appsettings.PARLER_CACHE_TIMEOUT
+    queue = getattr(_write_queue, 'data', None)
+    if getattr(_held_locks, 'count', 0):
+        # Other processes wait for these values, so store them before the refill lock is released.
+        # Keys with queued changes of this thread stay queued.
+        direct = dict((key, value) for key, value in data.iteritems() if queue is None or key not in queue)
+        for key in data:
+            if key not in direct:
+                queue[key] = (data[key], timeout)
+        if direct:
+            _backend_set_many(direct, timeout=timeout)
+    elif queue is not None:
+        for key, value in data.iteritems():
+            queue[key] = (value, timeout)
+    elif background and appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS:
+        _write_behind.put(data, timeout=timeout)
+        if appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+            _local_cache.set_many(data, timeout=timeout)
+    else:
+        _backend_set_many(data, timeout=timeout)
+
+    request_data = getattr(_request_cache, 'data', None)
+    if request_data is not None:
+        request_data.update(data)
+
+
+def _cache_add_many(data, timeout=None, background=False):
+    # Store values which may not replace an existing entry, e.g. a marker for a missing translation.
+    # A reader which missed before another process saved the value can't overwrite it then.
+    if timeout is None:
+        timeout = appsettings.PARLER_CACHE_TIMEOUT
+    queue = getattr(_write_queue, 'data', None)
+    if queue:
+        data = dict((key, value) for key, value in data.iteritems() if key not in queue)  # changed by this thread, not stored yet.
+    if not data:
+        return
+
+    if background and appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS and not getattr(_held_locks, 'count', 0):
+        _write_behind.put(data, timeout=timeout, add=True)
+        return
+
+    added = _backend_add_many(data, timeout=timeout)
+    request_data = getattr(_request_cache, 'data', None)
+    if request_data is not None:
+        request_data.update(added)
+
+
+def _backend_add_many(data, timeout=None):
+    # The backends have no add_many(), each key is added separately.
+    added = {}
+    for key, value in data.iteritems():
+        if _breaker.call(cache.add, False, key, _compress_data({key: value})[key], timeout=timeout):
+            added[key] = value
+
+    if added and appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+        _local_cache.set_many(added, timeout=timeout)
+    return added
+
+
+def _cache_delete_many(keys):
+    queue = getattr(_write_queue, 'data', None)
+    if queue is not None:
+        for key in keys:
+            queue[key] = (_DELETED, None)
+    else:
+        _backend_delete_many(keys)
+
+    request_data = getattr(_request_cache, 'data', None)
+    if request_data is not None:
+        for key in keys:
+            request_data.pop(key, None)
+
+
+def _backend_set_many(data, timeout=None):
+    _write_behind.discard(data)  # avoid overwriting the new values with older pending values.
+    _breaker.call_write(cache.set_many, data.keys(), _compress_data(data), timeout=timeout)
+    if appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+        _local_cache.set_many(data, timeout=timeout)
+
+
+def _backend_delete_many(keys):
+    _write_behind.discard(keys)
+    _breaker.call_write(cache.delete_many, keys, keys)
+    _local_cache.delete_many(keys)
+
+
+class WriteBehindQueue(object):
+    """
+    Store cache entries from background threads, so filling the cache after a read miss doesn't delay the request.
+
+    The number of threads is configured by the ``PARLER_CACHE_WRITE_BEHIND_THREADS`` setting.
+    When more than ``PARLER_CACHE_WRITE_BEHIND_QUEUE_SIZE`` entries are pending, new entries are dropped.
+    Those are fetched and stored again by a next read.
+    """
+
+    def __init__(self):
+        self._pending = OrderedDict()  # key -> (value, timeout, add)
+        self._writing = {}             # key -> number of batches which are being written.
+        self._stale = set()            # keys which are changed while they were being written.
+        self._condition = threading.Condition()
+        self._threads = []
+        self._pid = os.getpid()
+        self._in_flight = 0
+        self.written = 0
+        self.dropped = 0
+
+    def put(self, data, timeout=None, add=False):
+        with self._condition:
+            for key, value in data.iteritems():
+                if key not in self._pending and len(self._pending) >= appsettings.PARLER_CACHE_WRITE_BEHIND_QUEUE_SIZE:
+                    self.dropped += 1
+                else:
+                    self._pending[key] = (value, timeout, add)
+
+            self._start_threads()
+            self._condition.notify_all()
+
+    def discard(self, keys):
+        """
+        Drop the pending entries, as the keys are updated or deleted by the current thread.
+
+        When a background thread is writing one of the keys, this waits until the write is done,
+        so the older value doesn't land after the change. When that takes too long,
+        the keys are marked as stale, and the background thread deletes them after writing.
+        """
+        if not self._pending and not self._writing:
+            return
+
+        with self._condition:
+            for key in keys:
+                self._pending.pop(key, None)
+
+            deadline = time.time() + appsettings.PARLER_CACHE_LATENCY_BUDGET
+            busy = [key for key in keys if key in self._writing]
+            while busy:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    self._stale.update(busy)
+                    break
+                self._condition.wait(remaining)
+                busy = [key for key in busy if key in self._writing]
+
+    def flush(self):
+        """
+        Write the pending entries in the current thread, and wait for the background threads to finish.
+        """
+        with self._condition:
+            items = self._take()
+        try:
+            self._write(items)
+        finally:
+            self._done(items)
+
+        with self._condition:
+            while self._in_flight:
+                self._condition.wait()
+
+    def get_stats(self):
+        return {
+            'queued': len(self._pending),
+            'written': self.written,
+            'dropped': self.dropped,
+        }
+
+    def _start_threads(self):
+        if self._pid != os.getpid():
+            # A forked process (e.g. a preloading gunicorn or uwsgi) doesn't inherit the running threads,
+            # and the writes they were doing won't finish there.
+            self._pid = os.getpid()
+            self._writing.clear()
+            self._stale.clear()
+            self._in_flight = 0
+
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS:
+            thread = threading.Thread(target=self._run, name='parler-write-behind')
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def _take(self):
+        # Take the pending entries, and track which keys are being written.
+        items = self._pending.items()
+        self._pending.clear()
+        for key, _ in items:
+            self._writing[key] = self._writing.get(key, 0) + 1
+        return items
+
+    def _done(self, items):
+        # Mark the keys as written, and remove the keys that were changed in the meantime.
+        stale = []
+        with self._condition:
+            for key, _ in items:
+                count = self._writing.pop(key) - 1
+                if count:
+                    self._writing[key] = count
+                if key in self._stale:
+                    stale.append(key)
+                    if not count:
+                        self._stale.discard(key)
+            self._condition.notify_all()
+
+        if stale:
+            # Deleting is safe, the next read fetches the current value again.
+            try:
+                _breaker.call_write(cache.delete_many, stale, stale)
+            except Exception:
+                logger.exception("Failed to delete %d stale translation cache entries", len(stale))
+            _local_cache.delete_many(stale)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                items = self._take()
+                self._in_flight += 1
+
+            try:
+                self._write(items)
+            finally:
+                self._done(items)
+                with self._condition:
+                    self._in_flight -= 1
+                    self._condition.notify_all()
+
+    def _write(self, items):
+        groups = {}
+        for key, (value, timeout, add) in items:
+            groups.setdefault((timeout, add), {})[key] = value
+
+        for (timeout, add), data in groups.iteritems():
+            try:
+                if add:
+                    self.written += len(_backend_add_many(data, timeout=timeout))
+                elif _breaker.call_write(cache.set_many, data.keys(), _compress_data(data), timeout=timeout):
+                    self.written += len(data)
+            except Exception:
+                logger.exception("Failed to store %d translation cache entries", len(data))
+
+
+_write_behind = WriteBehindQueue()
+
+
+class CircuitBreaker(object):
+    """
+    Stop using the cache backend for a while, when it's slow or failing.
+
+    After ``PARLER_CACHE_BREAKER_THRESHOLD`` calls in a row which failed or took longer than ``PARLER_CACHE_LATENCY_BUDGET`` seconds,
+    the cache backend is skipped for ``PARLER_CACHE_BREAKER_COOLDOWN`` seconds. The translations are read from the database
+    (or the in-process cache) instead. After the cool-down period, a single call probes whether the backend recovered.
+    """
+
+    def __init__(self):
+        self.failures = 0
+        self.trips = 0
+        self.skipped = 0
+        self._open_until = 0
+        self._probing = False
+        self._skipped_models = set()
+        self._lock = threading.Lock()
+
+    def is_open(self):
+        return self._open_until > time.time()
+
+    def call(self, method, default, *args, **kwargs):
+        """
+        Call the cache backend, or return the default when the backend is skipped or fails.
+        """
+        if not appsettings.PARLER_CACHE_BREAKER_THRESHOLD:
+            return method(*args, **kwargs)
+
+        if not self._allow():
+            self.skipped += 1
+            return default
+
+        start = time.time()
+        try:
+            result = method(*args, **kwargs)
+        except Exception:
+            logger.exception("Translation cache call failed")
+            self._record(False)
+            return default
+        else:
+            self._record(time.time() - start <= appsettings.PARLER_CACHE_LATENCY_BUDGET)
+            return result
+
+    def call_write(self, method, keys, *args, **kwargs):
+        """
+        Update the cache backend. Returns ``False`` when the change is skipped or failed.
+        """
+        result = self.call(method, self, *args, **kwargs)
+        if result is self:
+            self.add_skipped_keys(keys)
+            return False
+        return True
+
+    def add_skipped_keys(self, keys):
+        """
+        Remember that changes of these keys were not written.
+        """
+        # The entries can be outdated when the backend is used again, remember to invalidate the models.
+        with self._lock:
+            self._skipped_models.update(key.split('.')[1] for key in keys)
+
+    def get_state(self):
+        if not self._open_until:
+            state = 'closed'
+        elif self.is_open() and not self._probing:
+            state = 'open'
+        else:
+            state = 'half-open'
+
+        return {
+            'state': state,
+            'failures': self.failures,
+            'trips': self.trips,
+            'skipped': self.skipped,
+        }
+
+    def _allow(self):
+        if not self._open_until:
+            return True
+
+        with self._lock:
+            now = time.time()
+            if self._probing or self._open_until > now:
+                return False
+
+            # Let this call probe the backend, other calls still skip it.
+            self._probing = True
+            return True
+
+    def _record(self, success):
+        recovered = None
+        with self._lock:
+            if success:
+                self.failures = 0
+                if self._open_until:
+                    self._open_until = 0
+                    self._probing = False
+                    recovered = self._skipped_models
+                    self._skipped_models = set()
+            else:
+                self.failures += 1
+                if self._probing or self.failures >= appsettings.PARLER_CACHE_BREAKER_THRESHOLD:
+                    if not self._open_until or self._probing:
+                        self.trips += 1
+                    self._open_until = time.time() + appsettings.PARLER_CACHE_BREAKER_COOLDOWN
+                    self._probing = False
+
+        if recovered:
+            # Changes were not written to the cache, so invalidate the models.
+            for translated_model in list(_generations):
+                if translated_model.__name__ in recovered:
+                    bump_cache_generation(translated_model)
+
+
+_breaker = CircuitBreaker()
+
+
+def get_cache_breaker_state():
+    """
+    Return the state of the circuit breaker around the cache backend.
+
+    The dictionary contains the ``state`` (``closed``, ``open`` or ``half-open``),
+    the number of ``failures`` in a row, the number of ``trips`` and the number of ``skipped`` calls.
+    """
+    return _breaker.get_state()
+
+
+def flush_write_behind():
+    """
+    Store the entries which are pending for the background threads, e.g. in unit tests.
+    """
+    _write_behind.flush()
+
+
+def get_write_behind_stats():
+    """
+    Return the statistics of the background writes, as dictionary with the ``queued``, ``written`` and ``dropped`` entries.
+    """
+    return _write_behind.get_stats()
+
+
+class LocalCache(object):
+    """
+    A bounded least-recently-used cache in the memory of the process.
+
+    The size is limited by the ``PARLER_LOCAL_CACHE_MAX_ENTRIES`` and ``PARLER_LOCAL_CACHE_MAX_BYTES`` settings,
+    and entries expire after ``PARLER_LOCAL_CACHE_TIMEOUT`` seconds.
+    """
+
+    def __init__(self):
+        self._data = OrderedDict()  # key -> (value, expire time, size)
+        self._size = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_many(self, keys):
+        now = time.time()
+        result = {}
+        with self._lock:
+            for key in keys:
+                entry = self._data.pop(key, None)
+                if entry is None:
+                    continue
+
+                if entry[1] <= now:
+                    self._size -= entry[2]
+                else:
+                    self._data[key] = entry  # move to the end, as most recently used.
+                    result[key] = entry[0]
+        return result
+
+    def set_many(self, data, timeout=None):
+        expires = time.time() + min(timeout or appsettings.PARLER_LOCAL_CACHE_TIMEOUT, appsettings.PARLER_LOCAL_CACHE_TIMEOUT)
+        with self._lock:
+            for key, value in data.iteritems():
+                self._delete(key)
+                size = len(key) + _get_value_size(value)
+                self._data[key] = (value, expires, size)
+                self._size += size
+
+            # Remove the least recently used entries.
+            while self._data and (len(self._data) > appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES or self._size > appsettings.PARLER_LOCAL_CACHE_MAX_BYTES):
+                self._delete(next(iter(self._data)))
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._delete(key)
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            for key in [key for key in self._data if key.startswith(prefix)]:
+                self._delete(key)
+
+    def delete_objects(self, prefix, master_ids):
+        """
+        Remove the entries of objects, the keys have a ``{prefix}{generation}.{schema}.{id}`` format.
+        """
+        ids = set(str(master_id) for master_id in master_ids)
+        with self._lock:
+            for key in [key for key in self._data if key.startswith(prefix)]:
+                parts = key[len(prefix):].split('.', 3)
+                if len(parts) > 2 and parts[2] in ids:
+                    self._delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def _delete(self, key):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._size -= entry[2]
+
+
+def _get_value_size(value):
+    # A rough estimate of the memory used by a cached value.
+    if isinstance(value, basestring):
+        return len(value)
+    elif isinstance(value, dict):
+        return sum(len(key) + _get_value_size(item) for key, item in value.iteritems())
+    elif isinstance(value, (list, tuple)):
+        return sum(_get_value_size(item) for item in value)
+    else:
+        return 8
+
+
+_local_cache = LocalCache()
+
+
+# The number of changes that a process looks up to remove single objects from its local cache.
+# When more changes happened since the last check, all local entries of the model are removed.
+_MAX_TRACKED_CHANGES = 100
+
+
+def _check_local_version(translated_model, version, own_version=None):
+    # Remove the local entries of the objects which other processes changed.
+    previous = _local_versions.setdefault(translated_model, version)
+    if previous == version:
+        return
+
+    _local_versions[translated_model] = version
+    versions = [v for v in xrange(previous + 1, version + 1) if v != own_version] if 0 < version - previous <= _MAX_TRACKED_CHANGES else None
+    if versions == []:
+        return
+
+    if versions:
+        keys = [_get_changes_cache_key(translated_model, v) for v in versions]
+        changes = _breaker.call(cache.get_many, {}, keys)
+        if len(changes) == len(keys):
+            _local_cache.delete_objects(_get_model_key_prefix(translated_model), set(master_id for master_ids in changes.itervalues() for master_id in master_ids))
+            return
+
+    # Too many changes, or the list of changes expired.
+    _local_cache.delete_prefix(_get_model_key_prefix(translated_model))
+
+
+def _invalidate_local_objects(translated_model, master_ids):
+    # Let other processes remove the objects from their local cache.
+    # The local entries of this process are already updated by the write functions.
+    changed = getattr(_write_queue, 'changed', None)
+    if getattr(_write_queue, 'data', None) is not None and changed is not None:
+        # Published when the queued values are stored, so other processes don't fetch the old values again.
+        changed.setdefault(translated_model, set()).update(master_ids)
+    else:
+        _publish_local_changes(translated_model, master_ids)
+
+
+def _publish_local_changes(translated_model, master_ids):
+    key = _get_version_cache_key(translated_model)
+    version = _breaker.call(_increment_counter, None, key)
+    if version is None:
+        # Other processes are invalidated when the backend recovers.
+        _breaker.add_skipped_keys([key])
+        _local_cache.delete_prefix(_get_model_key_prefix(translated_model))
+        return
+
+    # Other processes read the list when they notice the new version.
+    # After the local timeout, their entries from before the change have expired anyway.
+    changes_key = _get_changes_cache_key(translated_model, version)
+    timeout = appsettings.PARLER_LOCAL_CACHE_TIMEOUT + appsettings.PARLER_CACHE_GENERATION_INTERVAL
+    _breaker.call_write(cache.set, [changes_key], changes_key, [long(master_id) for master_id in master_ids], timeout=timeout)
+    _check_local_version(translated_model, version, own_version=version)
+
+
+@receiver(post_translation_save)
+@receiver(post_translation_delete)
+def _on_translation_changed(sender, instance, **kwargs):
+    if appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+        _invalidate_local_objects(instance.__class__, [instance.master_id])
+
+
+def get_cached_available_languages(instance):
+    """
+    Fetch the cached list of language codes of an object.
+    Returns None if the list is not cached.
+    """
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return None
+
+    if appsettings.PARLER_CACHE_BUNDLE:
+        # The list is remembered when the bundle was fetched before.
+        languages = instance.__dict__.get('_bundle_languages')
+        if languages is None:
+            bundle = _get_cached_bundle(instance)
+            languages = sorted(bundle['translations']) if bundle is not None else None
+        return languages
+
+    key = get_available_languages_cache_key(instance._translations_model, instance.pk)
+    languages = _cache_get(key)
+    return list(languages) if languages is not None and languages != _INVALIDATED_MARKER else None
 
 
 def get_cached_translation(instance, language_code):
@@ -30,15 +999,164 @@ def get_cached_translation(instance, language_code):
     if not appsettings.PARLER_ENABLE_CACHING:
         return None
 
+    if appsettings.PARLER_CACHE_BUNDLE:
+        bundle = _get_cached_bundle(instance)
+        if bundle is None:
+            return None
+
+        # All languages are filled in the local cache, so fallback languages need no further lookups.
+        # Languages which are not part of the bundle don't exist.
+        return instance._translations_cache.setdefault(language_code, None)
+
     key = get_translation_cache_key(instance._translations_model, instance.pk, language_code)
-    values = cache.get(key)
+    values = _cache_get(key)
     if not values:
         return None
 
-    values['master'] = instance
-    values['language_code'] = language_code
-    translation = instance._translations_model(**values)
+    if values == MISSING_MARKER:
+        # The translation is known to be missing. Set the local marker,
+        # so the object won't query the database for it.
+        instance._translations_cache[language_code] = None
+        return None
+
+    if _is_refresh_due(values):
+        # Let this request fetch the translation again, before the entry expires for all requests.
+        return None
+
+    return _create_translation(instance, language_code, values)
+
+
+def get_cached_translations(items):
+    """
+    Fetch multiple cached translations with a single cache query.
+    Translations which are known to be missing are marked in the local cache of the instance.
+
+    :param items: A list of ``(instance, language_code)`` tuples.
+    :returns: A list of the translations which are found in the cache.
+    """
+    if not appsettings.PARLER_ENABLE_CACHING or not items:
+        return []
+
+    if appsettings.PARLER_CACHE_BUNDLE:
+        return _get_cached_bundles(items)
+
+    keys = {}
+    for instance, language_code in items:
+        key = get_translation_cache_key(instance._translations_model, instance.pk, language_code)
+        keys[key] = (instance, language_code)
+
+    translations = []
+    for key, values in _cache_get_many(keys.keys()).iteritems():
+        if values:
+            instance, language_code = keys[key]
+            if values == MISSING_MARKER:
+                instance._translations_cache[language_code] = None
+            elif not _is_refresh_due(values):
+                translations.append(_create_translation(instance, language_code, values))
+
+    return translations
+
+
+def get_cached_object(model, pk, language_codes, using=None, query_hash=''):
+    """
+    Fetch an object with its translations from the cache.
+    Returns None when the object, or one of the languages is not cached.
+
+    The ``query_hash`` identifies the queryset which fetched the object,
+    so objects are not returned by managers which would exclude them.
+    """
+    return _get_cached_object(model, pk, language_codes, using=using, query_hash=query_hash)[0]
+
+
+def _get_cached_object(model, pk, language_codes, using=None, query_hash=''):
+    # Also return the cached translations, so a miss for other languages can add to the entry instead of replacing it.
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return None, None
+
+    entry = _cache_get(get_object_cache_key(model._translations_model, pk))
+    if not entry or entry[0] != '{0}.{1}'.format(_get_shared_schema(model), query_hash):
+        # Not cached, or stored for a different model (e.g. the base class), field layout or manager.
+        return None, None
+
+    schema, shared_values, translations = entry
+    if any(language_code not in translations for language_code in language_codes):
+        return None, translations
+
+    instance = model(**dict(zip(_get_shared_fields(model), shared_values)))
+    instance._state.adding = False
+    instance._state.db = using
+    for language_code, values in translations.iteritems():
+        # None is a marker that the language doesn't exist.
+        instance._translations_cache[language_code] = _create_translation(instance, language_code, values) if values is not None else None
+    return instance, translations
+
+
+def _get_shared_fields(model):
+    # The attribute names of the shared fields, in the order of the cached values.
+    try:
+        return model.__dict__['_parler_shared_fields']
+    except KeyError:
+        model._parler_shared_fields = tuple(field.attname for field in model._meta.fields)
+        return model._parler_shared_fields
+
+
+def _get_shared_schema(model):
+    # Identify the model and shared fields of a cached object.
+    try:
+        return model.__dict__['_parler_shared_schema']
+    except KeyError:
+        fields_hash = hashlib.md5(','.join(_get_shared_fields(model))).hexdigest()[:8]
+        model._parler_shared_schema = '{0}.{1}.{2}'.format(model._meta.app_label, model.__name__, fields_hash)
+        return model._parler_shared_schema
+
+
+def _get_cached_bundle(instance):
+    # Fetch all translations of an object, and fill the local cache with it.
+    key = get_translation_bundle_cache_key(instance._translations_model, instance.pk)
+    bundle = _cache_get(key)
+    if bundle is not None:
+        _fill_from_bundle(instance, bundle)
+    return bundle
+
+
+def _get_cached_bundles(items):
+    # Fetch the bundles of multiple objects with a single cache query.
+    keys = {}
+    for instance, language_code in items:
+        key = get_translation_bundle_cache_key(instance._translations_model, instance.pk)
+        keys.setdefault(key, (instance, []))[1].append(language_code)
+
+    translations = []
+    for key, bundle in _cache_get_many(keys.keys()).iteritems():
+        instance, language_codes = keys[key]
+        _fill_from_bundle(instance, bundle)
+        for language_code in language_codes:
+            translation = instance._translations_cache.setdefault(language_code, None)
+            if translation is not None:
+                translations.append(translation)
+
+    return translations
+
+
+def _fill_from_bundle(instance, bundle):
+    # Don't overwrite translations that are already present, they could be modified.
+    for language_code, values in bundle['translations'].iteritems():
+        if language_code not in instance._translations_cache:
+            instance._translations_cache[language_code] = _create_translation(instance, language_code, values)
+
+    # Also remember the languages, so get_cached_available_languages() can answer without cache queries.
+    instance._bundle_languages = sorted(bundle['translations'])
+
+
+def _create_translation(instance, language_code, values):
+    # Construct the translation object from the cached values.
+    translated_model = instance._translations_model
+    values = _decode_values(values)
+    kwargs = dict(zip(_get_cache_fields(translated_model), values[1:]))
+    translation = translated_model(id=values[0], master=instance, language_code=language_code, **kwargs)
     translation._state.adding = False
+    if translated_model.heavy_fields:
+        translation._unload_heavy_fields()
     return translation
 
 
@@ -49,32 +1167,323 @@ def get_cached_translated_field(instance, language_code, field_name):
     if not appsettings.PARLER_ENABLE_CACHING:
         return None
 
-    values = get_translation_cache_key(instance._translations_model, instance.id, language_code)
-    if not values:
+    key = get_translation_cache_key(instance._translations_model, instance.pk, language_code)
+    values = _cache_get(key)
+    if not values or values == MISSING_MARKER:
         return None
 
-    # Allow older cached versions where the field didn't exist yet.
-    return values.get(field_name, None)
+    attname = instance._translations_model._meta.get_field(field_name).attname
+    if field_name in instance._translations_model.heavy_fields:
+        values = _cache_get(get_translated_field_cache_key(instance._translations_model, instance.pk, language_code, attname))
+        return _decode_values(values)[1] if values else None
+
+    values = _decode_values(values)
+    return values[_get_cache_fields(instance._translations_model).index(attname) + 1]
 
 
-def _cache_translation(translation, timeout=0):
+def _get_cached_heavy_field(translation, attname):
+    # Fetch a heavy field, returns a tuple with the value, or None when it's not cached.
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return None
+
+    key = get_translated_field_cache_key(translation.__class__, translation.master_id, translation.language_code, attname)
+    values = _cache_get(key)
+    return _decode_values(values)[1:] if values else None
+
+
+def _cache_heavy_field(translation, attname, value, timeout=None, background=False):
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return
+
+    key = get_translated_field_cache_key(translation.__class__, translation.master_id, translation.language_code, attname)
+    _cache_set_many({key: (translation.id, value)}, timeout=timeout, background=background)
+
+
+def _get_heavy_cache_data(translation):
+    # The cache entries of the heavy fields. Fields which are not loaded are skipped, their entry is still valid.
+    data = {}
+    for attname in translation.get_heavy_field_attnames():
+        if attname in translation.__dict__:
+            key = get_translated_field_cache_key(translation.__class__, translation.master_id, translation.language_code, attname)
+            data[key] = (translation.id, translation.__dict__[attname])
+    return data
+
+
+def _cache_translation(translation, timeout=None, background=False):
     if not appsettings.PARLER_ENABLE_CACHING:
         return
 
     # Cache a translation object.
     # For internal usage, object parameters are not suited for outside usage.
-    fields = translation.get_translated_fields()
-    values = {'id': translation.id}
-    for name in fields:
-        values[name] = getattr(translation, name)
+    # After a read miss, the heavy fields are cached on first access by TranslatedFieldsModel._load_heavy_field(),
+    # so fetching translations for a list page doesn't send them to the cache.
+    data = _get_heavy_cache_data(translation) if not background else {}
+    if not appsettings.PARLER_CACHE_BUNDLE:
+        # The bundle can only be stored with all languages, it's removed by _delete_cached_available_languages() instead.
+        key = get_translation_cache_key(translation.__class__, translation.master_id, translation.language_code)
+        data[key] = _add_refresh_header(_get_cache_values(translation), timeout)
+
+    if data:
+        _cache_set_many(data, timeout=timeout, background=background)
+
+
+def _cache_translations(translations, timeout=None, background=False):
+    if not appsettings.PARLER_ENABLE_CACHING or appsettings.PARLER_CACHE_BUNDLE or not translations:
+        return
+
+    # Cache multiple translation objects with a single cache query.
+    data = {}
+    for translation in translations:
+        key = get_translation_cache_key(translation.__class__, translation.master_id, translation.language_code)
+        data[key] = _add_refresh_header(_get_cache_values(translation), timeout)
+
+    # The heavy fields are cached on first access.
+    _cache_set_many(data, timeout=timeout, background=background)
+
+
+def _cache_translation_bundles(translated_model, master_ids, translations, timeout=None, background=False):
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return
+
+    # Cache all translations of the objects, one entry per object.
+    # Objects without any translation are stored too, so it's known that no language exists.
+    bundles = dict((master_id, {'translations': {}}) for master_id in master_ids)
+    for translation in translations:
+        bundles[translation.master_id]['translations'][translation.language_code] = _get_cache_values(translation)
+
+    # The heavy fields are cached on first access.
+    data = dict((get_translation_bundle_cache_key(translated_model, master_id), bundle) for master_id, bundle in bundles.iteritems())
+    _cache_set_many(data, timeout=timeout, background=background)
+
+
+def _cache_object(instance, language_codes, query_hash='', cached_translations=None, timeout=None, background=False):
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return
+
+    # Cache the shared fields and the translations of the given languages in a single entry.
+    # The languages of the existing entry are kept, so requests for different languages don't replace each other.
+    # That entry is removed by a save, so its translations are still valid.
+    translations = dict(cached_translations or {})
+    for language_code in language_codes:
+        translation = instance._translations_cache.get(language_code)
+        translations[language_code] = _get_cache_values(translation) if translation is not None else None
+
+    model = instance.__class__
+    shared_values = tuple(getattr(instance, attname) for attname in _get_shared_fields(model))
+    key = get_object_cache_key(instance._translations_model, instance.pk)
+    schema = '{0}.{1}'.format(_get_shared_schema(model), query_hash)
+    _cache_set_many({key: (schema, shared_values, translations)}, timeout=timeout, background=background)
+
+
+def _delete_cached_object(instance):
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return
+
+    _cache_delete_many([get_object_cache_key(instance._translations_model, instance.pk)])
+    if appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+        _invalidate_local_objects(instance._translations_model, [instance.pk])
+
+
+def _cache_available_languages(instance, language_codes, timeout=None, background=False):
+    if not appsettings.PARLER_ENABLE_CACHING or appsettings.PARLER_CACHE_BUNDLE:
+        return
+
+    # Cache the language codes of an object.
+    # This uses add(), so a list which is read before a translation is saved can't replace the invalidated marker.
+    key = get_available_languages_cache_key(instance._translations_model, instance.pk)
+    _cache_add_many({key: list(language_codes)}, timeout=timeout, background=background)
 
-    key = get_translation_cache_key(translation.__class__, translation.master_id, translation.language_code)
-    cache.set(key, values, timeout=timeout)
+
+def _invalidate_cached_available_languages(translation):
+    # The list is fetched again on the next read, once the marker expires.
+    key = get_available_languages_cache_key(translation.__class__, translation.master_id)
+    _cache_set_many({key: _INVALIDATED_MARKER}, timeout=_INVALIDATED_TIMEOUT)
+
+
+def _delete_cached_available_languages(translation, created=True):
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return
+
+    # The list of languages only changes when a translation is created.
+    # The bundle and the cached object contain the translations too, these are always removed.
+    if created:
+        _reset_bundle_languages(translation)
+        _invalidate_cached_available_languages(translation)
+    _cache_delete_many([
+        get_translation_bundle_cache_key(translation.__class__, translation.master_id),
+        get_object_cache_key(translation.__class__, translation.master_id),
+    ])
+
+
+def _reset_bundle_languages(translation):
+    # Clear the list of languages that the master object remembered from the bundle.
+    # The master is only checked when it's already fetched.
+    master = translation.__dict__.get(translation.__class__.master.cache_name)
+    if master is not None:
+        master.__dict__.pop('_bundle_languages', None)
+
+
+def _cache_missing_translation(instance, language_code, background=False):
+    if not appsettings.PARLER_ENABLE_CACHING or not appsettings.PARLER_CACHE_MISSING_TIMEOUT or appsettings.PARLER_CACHE_BUNDLE:
+        return
+
+    # Store a marker that the translation doesn't exist.
+    # Saving the translation replaces the marker with the actual values,
+    # and the marker can't replace a translation which another process saved in the meantime.
+    key = get_translation_cache_key(instance._translations_model, instance.pk, language_code)
+    _cache_add_many({key: MISSING_MARKER}, timeout=appsettings.PARLER_CACHE_MISSING_TIMEOUT, background=background)
+
+
+def _cache_missing_translations(items, background=False):
+    if not appsettings.PARLER_ENABLE_CACHING or not appsettings.PARLER_CACHE_MISSING_TIMEOUT or appsettings.PARLER_CACHE_BUNDLE or not items:
+        return
+
+    # Store the missing markers for multiple ``(instance, language_code)`` pairs.
+    data = {}
+    for instance, language_code in items:
+        key = get_translation_cache_key(instance._translations_model, instance.pk, language_code)
+        data[key] = MISSING_MARKER
+
+    _cache_add_many(data, timeout=appsettings.PARLER_CACHE_MISSING_TIMEOUT, background=background)
+
+
+def _get_cache_values(translation):
+    # Store the values as tuple, the field names are part of the schema hash in the cache key.
+    return (translation.id,) + tuple(getattr(translation, attname) for attname in _get_cache_fields(translation.__class__))
+
+
+def _decode_values(values):
+    # Remove the header which is added to the cached values.
+    if values[0] == _REFRESH_MARKER:
+        return values[2]
+    return values
+
+
+def _compress_data(data):
+    # Compress the values which are sent to the cache backend.
+    if not appsettings.PARLER_CACHE_COMPRESS_MIN_SIZE:
+        return data
+    return dict((key, _compress_value(value)) for key, value in data.iteritems())
+
+
+def _compress_value(value):
+    # Large values (e.g. HTML text) are compressed, so they don't push other entries out of the cache.
+    if _get_value_size(value) < appsettings.PARLER_CACHE_COMPRESS_MIN_SIZE:
+        return value
+
+    data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    compressed = zlib.compress(data)
+    if len(compressed) >= len(data):
+        return value
+
+    with _compression_lock:
+        _compression_stats['compressed'] += 1
+        _compression_stats['original_bytes'] += len(data)
+        _compression_stats['compressed_bytes'] += len(compressed)
+    return (_COMPRESSED_MARKER, compressed)
+
+
+def _decompress_data(data):
+    # Decompress the values which are read from the cache backend.
+    for key, value in data.iteritems():
+        if isinstance(value, tuple) and value and value[0] == _COMPRESSED_MARKER:
+            data[key] = _decompress_value(value)
+    return data
+
+
+def _decompress_value(value):
+    if not isinstance(value, tuple) or not value or value[0] != _COMPRESSED_MARKER:
+        return value
+
+    start = time.time()
+    value = pickle.loads(zlib.decompress(value[1]))
+    with _compression_lock:
+        _compression_stats['decompressed'] += 1
+        _compression_stats['decompress_time'] += time.time() - start
+    return value
+
+
+def _add_refresh_header(values, timeout=None):
+    # Store the expire time with the values, so the entry can be refreshed before it expires.
+    if not appsettings.PARLER_CACHE_EARLY_REFRESH:
+        return values
+    return (_REFRESH_MARKER, time.time() + (timeout or appsettings.PARLER_CACHE_TIMEOUT or cache.default_timeout), values)
+
+
+def _is_refresh_due(values):
+    # Probabilistic early refresh: the closer the entry is to its expire time, the more likely one request fetches it again.
+    # This avoids that all requests miss the entry at the same moment.
+    if values[0] != _REFRESH_MARKER or not appsettings.PARLER_CACHE_EARLY_REFRESH:
+        return False
+    return time.time() - appsettings.PARLER_CACHE_EARLY_REFRESH * math.log(1.0 - random.random()) >= values[1]
+
+
+@contextmanager
+def _refill_lock(translated_model, master_id):
+    """
+    Let one process fetch the translations of an object, while other processes wait for the cache to be filled.
+
+    This yields ``False`` when another process held the lock, so the cache should be read again.
+    When the lock is not released in time, the waiting process continues as well.
+    """
+    if not appsettings.PARLER_ENABLE_CACHING or not appsettings.PARLER_CACHE_LOCK_TIMEOUT or master_id is None or _breaker.is_open():
+        yield True
+        return
+
+    object_key = get_translation_bundle_cache_key(translated_model, master_id)
+    lock_key = object_key + '.lock'
+    if _breaker.call(cache.add, True, lock_key, 1, timeout=appsettings.PARLER_CACHE_LOCK_TIMEOUT):
+        _held_locks.count = getattr(_held_locks, 'count', 0) + 1
+        try:
+            yield True
+        finally:
+            _held_locks.count -= 1
+            _breaker.call(cache.delete, None, lock_key)
+    else:
+        deadline = time.time() + appsettings.PARLER_CACHE_LOCK_WAIT
+        while time.time() < deadline and _breaker.call(cache.get, None, lock_key) is not None:
+            time.sleep(0.05)
+
+        _forget_request_cache(object_key)
+        yield False
+
+
+def _forget_request_cache(object_key):
+    # Remove the entries of an object from the request cache, so they are read again from the cache backend.
+    data = getattr(_request_cache, 'data', None)
+    if data:
+        for key in [key for key in data if key == object_key or key.startswith(object_key + '.')]:
+            del data[key]
+
+
+def get_compression_stats():
+    """
+    Return the statistics of the compressed cache values in this process.
+
+    The dictionary contains the number of ``compressed`` values, the ``ratio`` of the compressed size,
+    the number of ``decompressed`` values and the ``decompress_time`` in seconds.
+    """
+    with _compression_lock:
+        stats = dict(_compression_stats)
+    stats['ratio'] = float(stats['compressed_bytes']) / stats['original_bytes'] if stats['original_bytes'] else None
+    return stats
+
+
+def reset_compression_stats():
+    """
+    Reset the statistics of the compressed cache values.
+    """
+    with _compression_lock:
+        _compression_stats.update(compressed=0, original_bytes=0, compressed_bytes=0, decompressed=0, decompress_time=0.0)
 
 
 def _delete_cached_translations(shared_model):
-    for key in get_object_cache_keys(shared_model):
-        cache.delete(key)
+    if not appsettings.PARLER_ENABLE_CACHING:
+        return
+
+    _cache_delete_many(get_object_cache_keys(shared_model))
+    if appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES:
+        _invalidate_local_objects(shared_model._translations_model, [shared_model.pk])
 
 
 def _delete_cached_translation(translation):
@@ -83,5 +1492,13 @@ def _delete_cached_translation(translation):
 
     # Delete a cached translation
     # For internal usage, object parameters are not suited for outside usage.
-    key = get_translation_cache_key(translation.__class__, translation.master_id, translation.language_code)
-    cache.delete(key)
+    _reset_bundle_languages(translation)
+    _invalidate_cached_available_languages(translation)
+    _cache_delete_many([
+        get_translation_cache_key(translation.__class__, translation.master_id, translation.language_code),
+        get_translation_bundle_cache_key(translation.__class__, translation.master_id),
+        get_object_cache_key(translation.__class__, translation.master_id),
+    ] + [
+        get_translated_field_cache_key(translation.__class__, translation.master_id, translation.language_code, attname)
+        for attname in translation.get_heavy_field_attnames()
+    ])
@@ -93,6 +93,40 @@ class TranslatedFieldDescriptor(object):
         return "<{0} for {1}.{2}>".format(self.__class__.__name__, self.field.model.__name__, self.field.name)
 
 
+class _NotLoaded(object):
+    """
+    Marker for a heavy field which is not loaded yet.
+    It's compared by identity, so pickling and copying return the module-level instance.
+    """
+    def __reduce__(self):
+        return 'NOT_LOADED'
+
+    def __repr__(self):
+        return '<NOT_LOADED>'
+
+NOT_LOADED = _NotLoaded()
+
+
+class HeavyFieldDescriptor(object):
+    """
+    Descriptor for the heavy fields of the translated model.
+
+    When the translation is read from the cache, the heavy fields are not part of it.
+    The value is loaded on first access, and stored as regular instance attribute.
+    """
+    NOT_LOADED = NOT_LOADED
+
+    def __init__(self, attname):
+        self.attname = attname
+
+    def __get__(self, instance, instance_type=None):
+        if instance is None:
+            return self
+
+        # Only called when the instance attribute doesn't exist.
+        return instance._load_heavy_field(self.attname)
+
+
 class LanguageCodeDescriptor(object):
     """
     This is the property to access the ``language_code`` in the ``TranslatableModel``.
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import get_model, get_models
+from parler.cache import bump_cache_generation
+from parler.models import TranslatableModel
+
+
+class Command(BaseCommand):
+    """
+    Invalidate the cached translations of models, e.g. after a bulk import.
+    """
+    args = '[app_label.ModelName ...]'
+    help = "Invalidate the cached translations of the given models, or all translatable models."
+
+    def handle(self, *args, **options):
+        if args:
+            models = []
+            for name in args:
+                try:
+                    app_label, model_name = name.split('.')
+                except ValueError:
+                    raise CommandError("Expected app_label.ModelName, not '{0}'".format(name))
+
+                model = get_model(app_label, model_name)
+                if model is None or not issubclass(model, TranslatableModel):
+                    raise CommandError("'{0}' is not a translatable model".format(name))
+                models.append(model)
+        else:
+            models = [model for model in get_models() if issubclass(model, TranslatableModel) and model._translations_model is not None]
+
+        for model in models:
+            bump_cache_generation(model)
+            if int(options.get('verbosity', 1)) >= 1:
+                self.stdout.write("Invalidated cached translations of {0}.{1}\n".format(model._meta.app_label, model.__name__))
@@ -1,11 +1,18 @@
 """
 Custom generic managers
 """
-from django.db import models
-from django.db.models.query import QuerySet
+import datetime
+import hashlib
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections, models, router
+from django.db.models.fields import FieldDoesNotExist
+from django.db.models.query import QuerySet, ValuesQuerySet, ValuesListQuerySet, ITER_CHUNK_SIZE, prefetch_related_objects
+from django.utils.datastructures import SortedDict
 from django.utils.translation import get_language
 from parler import appsettings
-from parler.utils import get_active_language_choices
+from parler.cache import _get_cached_object, _cache_object
+from parler.utils import get_active_language_choices, normalize_language_code, prefetch_translations, get_fallback_languages, \
+    is_supported_django_language
 
 
 class TranslatableQuerySet(QuerySet):
@@ -19,11 +26,19 @@ class TranslatableQuerySet(QuerySet):
     def __init__(self, *args, **kwargs):
         super(TranslatableQuerySet, self).__init__(*args, **kwargs)
         self._language = []
+        self._prefetch_translation_languages = None
+        self._prefetch_translation_paths = ()
+        self._batch_translations = appsettings.PARLER_AUTO_BATCH
+        self._translated_annotations = ()
 
 
     def _clone(self, klass=None, setup=False, **kw):
         c = super(TranslatableQuerySet, self)._clone(klass, setup, **kw)
         c._language = self._language
+        c._prefetch_translation_languages = self._prefetch_translation_languages
+        c._prefetch_translation_paths = self._prefetch_translation_paths
+        c._batch_translations = self._batch_translations
+        c._translated_annotations = self._translated_annotations
         return c
 
 
@@ -55,7 +70,10 @@ class TranslatableQuerySet(QuerySet):
         if len(language_codes) == 1:
             return self.filter(**{relname + '__language_code': language_codes[0]})
         else:
-            return self.filter(**{relname + '__language_code__in': language_codes}).distinct()
+            # Filter with a subquery, so the objects are not returned once per language.
+            # This avoids a slow DISTINCT over the whole row, which also affects the count() of the paginator.
+            translations = self.model._translations_model.objects.filter(language_code__in=language_codes)
+            return self.filter(pk__in=translations.values('master'))
 
 
     def active_translations(self, language_code=None):
@@ -71,6 +89,236 @@ class TranslatableQuerySet(QuerySet):
         return self.translated(*language_codes)
 
 
+    def prefetch_translations(self, *lookups):
+        """
+        Fetch the translations of all retrieved objects in a single query.
+
+        When no language codes are given, the current language and fallback language of each object is fetched.
+        Languages that don't exist are marked as missing, so reading the translated
+        attributes of the retrieved objects won't perform any additional queries.
+
+        Relation paths (e.g. ``'category'``, ``'tags'`` or ``'category__parent'``) can be given too,
+        to fetch the related translatable objects and their translations in the same way.
+        This performs one query for the related objects (like ``prefetch_related()`` does),
+        and one query for their translations.
+        Names which are neither a relation nor a language of the ``LANGUAGES`` setting raise a ``FieldDoesNotExist`` error.
+        """
+        language_codes = []
+        paths = []
+        for lookup in lookups:
+            if self._is_relation_path(lookup):
+                paths.append(lookup)
+            else:
+                language_codes.append(normalize_language_code(lookup))
+
+        c = self._clone()
+        c._prefetch_translation_languages = tuple(language_codes) or self._prefetch_translation_languages or ()
+        c._prefetch_translation_paths = self._prefetch_translation_paths + tuple(paths)
+        return c
+
+
+    def _is_relation_path(self, lookup):
+        """
+        Tell whether the lookup is a relation path, or a language code.
+        Lookups which are neither raise an error, so a typing error in a relation path is noticed.
+        """
+        names = lookup.split('__')
+        opts = self.model._meta
+        for i, name in enumerate(names):
+            try:
+                field, model, direct, m2m = opts.get_field_by_name(name)
+            except FieldDoesNotExist:
+                if len(names) == 1 and is_supported_django_language(normalize_language_code(lookup)):
+                    return False
+                raise FieldDoesNotExist("'{0}' is not a relation of {1} or a language code.".format(lookup, self.model.__name__))
+
+            if direct and not field.rel:
+                raise FieldDoesNotExist("'{0}' in '{1}' is not a relation.".format(name, lookup))
+            opts = field.rel.to._meta if direct else field.model._meta
+
+        return True
+
+
+    def batch_translations(self, enable=True):
+        """
+        Link all retrieved objects, so a missing translation is fetched for all objects at once.
+
+        When one object needs to fetch its translation, the current and fallback language
+        of all other objects in the result set are fetched in the same query.
+        This avoids a query for every object, without having to know upfront which languages are read.
+        The default is configured by the ``PARLER_AUTO_BATCH`` setting.
+        """
+        c = self._clone()
+        c._batch_translations = enable
+        return c
+
+
+    def values(self, *fields):
+        # Hide the private columns of order_by_translated().
+        return self._clone(klass=TranslatableValuesQuerySet, setup=True, _fields=fields)
+
+
+    def values_list(self, *fields, **kwargs):
+        flat = kwargs.pop('flat', False)
+        if kwargs:
+            raise TypeError('Unexpected keyword arguments to values_list: %s' % (list(kwargs),))
+        if flat and len(fields) > 1:
+            raise TypeError("'flat' is not valid when values_list is called with more than one field.")
+        return self._clone(klass=TranslatableValuesListQuerySet, setup=True, flat=flat, _fields=fields)
+
+
+    def annotate_translations(self, *names, **kwargs):
+        """
+        Add the translated fields as value to the query, using the fallback language when a translation is missing.
+
+        The values are calculated by the database, so they can be used in ``values()``,
+        ``values_list()`` and ``order_by()`` without constructing any translation objects.
+        The current language is used, unless a ``language_code`` keyword argument is given.
+        """
+        language_code = kwargs.pop('language_code', None)
+        if kwargs:
+            raise TypeError("annotate_translations() got an unexpected keyword argument '{0}'".format(kwargs.keys()[0]))
+
+        return self._annotate_translations(names, self._get_language_chain(language_code))
+
+
+    def _annotate_translations(self, names, language_codes):
+        translations_model = self.model._translations_model
+        select = SortedDict()
+        select_params = []
+        for name in names:
+            if name not in translations_model.get_translated_fields():
+                raise FieldDoesNotExist("{0} has no translated field named '{1}'".format(self.model.__name__, name))
+
+            attname = translations_model._meta.get_field(name).attname
+            select[name] = _get_coalesced_column_sql(self.model, attname, len(language_codes), self.db)
+            select_params.extend(language_codes)
+
+        c = self.extra(select=select, select_params=select_params)
+        c._translated_annotations = self._translated_annotations + tuple(names)
+        return c
+
+
+    def order_by_translated(self, *field_names, **kwargs):
+        """
+        Order the results by translated fields, using the fallback language when a translation is missing.
+
+        This works like ``order_by()``, but the translated field names (e.g. ``'-title'``) sort on a single value
+        per object, so there are no duplicate results like ``order_by('translations__title')`` gives.
+        Shared field names can be given too.
+        The current language is used, unless a ``language_code`` keyword argument is given.
+        """
+        language_code = kwargs.pop('language_code', None)
+        if kwargs:
+            raise TypeError("order_by_translated() got an unexpected keyword argument '{0}'".format(kwargs.keys()[0]))
+
+        language_codes = self._get_language_chain(language_code)
+        translated_fields = self.model._translations_model.get_translated_fields()
+        select = SortedDict()
+        select_params = []
+        ordering = []
+        for field_name in field_names:
+            prefix, name = ('-', field_name[1:]) if field_name.startswith('-') else ('', field_name)
+            if name not in translated_fields:
+                ordering.append(field_name)
+                continue
+
+            attname = self.model._translations_model._meta.get_field(name).attname
+            alias = _get_ordering_alias(name)
+            select[alias] = _get_coalesced_column_sql(self.model, attname, len(language_codes), self.db)
+            select_params.extend(language_codes)
+            ordering.append(prefix + alias)
+
+        return self.extra(select=select, select_params=select_params).order_by(*ordering)
+
+
+    def translated_values(self, *fields, **kwargs):
+        """
+        Iterate over the shared and translated field values as dictionaries, without constructing any model objects.
+
+        When the queryset has no ordering, the rows are read in chunks of ``PARLER_VALUES_CHUNK_SIZE`` objects
+        (ordered by primary key), so large exports don't need to fit in memory.
+        A queryset with an ordering or slice is read in a single query.
+        The current language is used, unless a ``language_code`` keyword argument is given.
+        Missing translations are read from the fallback language, unless ``fallback=False`` is given.
+        """
+        return self._iter_value_chunks(self._get_translated_values(fields, kwargs), fields, as_tuples=False)
+
+
+    def translated_values_list(self, *fields, **kwargs):
+        """
+        Iterate over the shared and translated field values as tuples, without constructing any model objects.
+        This works like :func:`translated_values`.
+        """
+        fields = fields or self._get_all_value_fields()
+        return self._iter_value_chunks(self._get_translated_values(fields, kwargs), fields, as_tuples=True)
+
+
+    def _get_translated_values(self, fields, kwargs):
+        """
+        Add the translated fields to the query, for the translated_values() functions.
+        """
+        language_code = kwargs.pop('language_code', None)
+        fallback = kwargs.pop('fallback', True)
+        if kwargs:
+            raise TypeError("Unexpected keyword argument '{0}'".format(kwargs.keys()[0]))
+
+        translated_fields = self.model._translations_model.get_translated_fields()
+        names = [name for name in (fields or translated_fields) if name in translated_fields]
+        return self._annotate_translations(names, self._get_language_chain(language_code, fallback))
+
+
+    def _iter_value_chunks(self, queryset, fields, as_tuples):
+        """
+        Iterate over the values, reading a limited number of objects per query.
+        """
+        query = queryset.query
+        if queryset.ordered or query.low_mark or query.high_mark is not None:
+            # The chunks are ordered by primary key, which would change the requested order.
+            values = queryset.values_list(*fields) if as_tuples else queryset.values(*fields)
+            for row in values.iterator():
+                yield row
+            return
+
+        # Include the primary key, to start the next chunk after the last object.
+        pk_field = 'pk' if 'pk' in fields else self.model._meta.pk.attname
+        add_pk = bool(fields) and pk_field not in fields
+        value_fields = list(fields) + [pk_field] if add_pk else fields
+
+        chunk_size = appsettings.PARLER_VALUES_CHUNK_SIZE
+        chunk_qs = queryset.order_by('pk')
+        while True:
+            rows = list((chunk_qs.values_list(*value_fields) if as_tuples else chunk_qs.values(*value_fields))[:chunk_size])
+            for row in rows:
+                last_pk = row[value_fields.index(pk_field)] if as_tuples else row[pk_field]
+                if add_pk:
+                    if as_tuples:
+                        row = row[:-1]
+                    else:
+                        del row[pk_field]
+                yield row
+
+            if len(rows) < chunk_size:
+                return
+            chunk_qs = queryset.filter(pk__gt=last_pk).order_by('pk')
+
+
+    def _get_all_value_fields(self):
+        # The field names for values_list() without arguments; the shared fields, followed by the translated fields.
+        return [field.attname for field in self.model._meta.fields] + self.model._translations_model.get_translated_fields()
+
+
+    def _get_language_chain(self, language_code=None, fallback=True):
+        """
+        Return the language and fallback languages to fetch.
+        """
+        language_code = normalize_language_code(language_code or self._language or get_language())
+        language_codes = [language_code]
+        if fallback:
+            language_codes += [code for code in get_fallback_languages(language_code) if code not in language_codes]
+        return language_codes
+
+
     def iterator(self):
         """
         Overwritten iterator which will apply the decorate functions before returning it.
@@ -78,15 +326,195 @@ class TranslatableQuerySet(QuerySet):
         # Based on django-queryset-transform.
         # This object however, operates on a per-object instance
         # without breaking the result generators
-        base_iterator = super(TranslatableQuerySet, self).iterator()
-        for obj in base_iterator:
-            # Apply the language setting.
-            if self._language:
-                obj.set_current_language(self._language)
+        if self._translated_annotations:
+            base_iterator = self._get_annotated_iterator()
+        else:
+            base_iterator = super(TranslatableQuerySet, self).iterator()
+
+        ordering_aliases = [name for name in self.query.extra_select if _is_ordering_alias(name)]
+        if ordering_aliases:
+            base_iterator = self._remove_ordering_values(base_iterator, ordering_aliases)
+
+        if self._prefetch_translation_languages is None and not self._batch_translations:
+            for obj in base_iterator:
+                # Apply the language setting.
+                if self._language:
+                    obj.set_current_language(self._language)
+
+                yield obj
+        else:
+            # Collect the objects in chunks, so the translations can be fetched in a single query,
+            # while still not reading the complete result set in memory.
+            chunk = []
+            for obj in base_iterator:
+                if self._language:
+                    obj.set_current_language(self._language)
+
+                chunk.append(obj)
+                if len(chunk) >= ITER_CHUNK_SIZE:
+                    self._process_chunk(chunk)
+                    for obj in chunk:
+                        yield obj
+                    chunk = []
+
+            if chunk:
+                self._process_chunk(chunk)
+                for obj in chunk:
+                    yield obj
+
 
+    def _get_annotated_iterator(self):
+        """
+        Fetch the objects with the translated annotations under a different name.
+        Django would otherwise assign the values to the translated attributes of the model.
+        """
+        c = self._clone()
+        query = c.query
+        renamed = dict((name, _get_annotation_alias(name)) for name in self._translated_annotations)
+        query.extra = SortedDict((renamed.get(name, name), value) for name, value in query.extra.iteritems())
+        if query.extra_select_mask is not None:
+            query.set_extra_mask([renamed.get(name, name) for name in query.extra_select_mask])
+
+        def _rename_ordering(ordering):
+            if ordering.startswith('-'):
+                return '-' + renamed.get(ordering[1:], ordering[1:])
+            return renamed.get(ordering, ordering)
+
+        query.order_by = [_rename_ordering(ordering) for ordering in query.order_by]
+        query.extra_order_by = [_rename_ordering(ordering) for ordering in query.extra_order_by]
+
+        for obj in super(TranslatableQuerySet, c).iterator():
+            for alias in renamed.itervalues():
+                del obj.__dict__[alias]
             yield obj
 
 
+    def _remove_ordering_values(self, objects, aliases):
+        # The values of order_by_translated() are only needed by the database.
+        for obj in objects:
+            for alias in aliases:
+                obj.__dict__.pop(alias, None)
+            yield obj
+
+
+    def _process_chunk(self, chunk):
+        """
+        Apply the translation settings to a set of retrieved objects.
+        """
+        if self._prefetch_translation_languages is not None:
+            prefetch_translations(chunk, self._prefetch_translation_languages)
+
+        if self._prefetch_translation_paths:
+            # Let Django fetch the related objects, then fetch all translations per relation path.
+            prefetch_related_objects(chunk, list(self._prefetch_translation_paths))
+            for path in self._prefetch_translation_paths:
+                related_objects = _get_related_objects(chunk, path)
+                if self._language:
+                    for obj in related_objects:
+                        obj.set_current_language(self._language)
+
+                prefetch_translations(related_objects, self._prefetch_translation_languages)
+
+        if self._batch_translations:
+            for obj in chunk:
+                obj._translations_batch = chunk
+
+
+class TranslatableValuesQuerySet(ValuesQuerySet):
+    """
+    The ``values()`` result of a :class:`TranslatableQuerySet`.
+
+    The private columns of :func:`~TranslatableQuerySet.order_by_translated` are not returned.
+    The ordering of :func:`~TranslatableQuerySet.order_by_translated` can't be combined with ``distinct()``.
+    """
+
+    def _setup_query(self):
+        super(TranslatableValuesQuerySet, self)._setup_query()
+        if self.extra_names is not None:
+            # The database can only sort on a column alias which is selected.
+            ordering_aliases = [name for name in self.query.extra if _is_ordering_alias(name) and name not in self.extra_names]
+            if ordering_aliases:
+                self.query.set_extra_mask(self.extra_names + ordering_aliases)
+        self._check_distinct()
+
+
+    def distinct(self, *field_names):
+        c = super(TranslatableValuesQuerySet, self).distinct(*field_names)
+        c._check_distinct()
+        return c
+
+
+    def _check_distinct(self):
+        # The database would apply DISTINCT to the hidden ordering value too,
+        # and removing those duplicates afterwards would break count() and slicing.
+        if self.query.distinct and self._get_hidden_ordering_aliases():
+            raise NotImplementedError("distinct() can't be combined with order_by_translated(), "
+                                      "select the translated field with annotate_translations() instead.")
+
+
+    def _get_hidden_ordering_aliases(self):
+        # The columns of order_by_translated() which are only selected for the ordering.
+        return [name for name in self.query.extra_select if _is_ordering_alias(name) and name not in self._fields]
+
+
+    def _as_sql(self, connection):
+        # As subquery (e.g. pk__in=...), only the requested column can be selected.
+        ordering_aliases = self._get_hidden_ordering_aliases()
+        if not ordering_aliases:
+            return super(TranslatableValuesQuerySet, self)._as_sql(connection)
+
+        query = self.query
+        if not query.low_mark and query.high_mark is None:
+            # Django removes the ordering of an unsliced subquery, so the ordering column can be left out.
+            c = self._clone()
+            c.query.set_extra_mask([name for name in query.extra_select if name not in ordering_aliases])
+            return super(TranslatableValuesQuerySet, c)._as_sql(connection)
+
+        # A sliced subquery needs its ordering, which the database can only apply on a selected column.
+        # Pick the requested column from a wrapping subquery instead. The inner query keeps the table names,
+        # as the SQL of order_by_translated() refers to the master table by name.
+        if self._db is not None and connection != connections[self._db]:
+            raise ValueError("Can't do subqueries with queries on different DBs.")
+        self._prepare()  # raises an error for multiple fields.
+        sql, params = query.get_compiler(connection=connection).as_sql()
+        column = self.extra_names[0] if self.extra_names else query.select[0][1]
+        qn = connection.ops.quote_name
+        return 'SELECT {0}.{1} FROM ({2}) {0}'.format(qn('_parler_subquery'), qn(column), sql), params
+
+
+    def iterator(self):
+        for row in super(TranslatableValuesQuerySet, self).iterator():
+            for name in [name for name in row if _is_private_alias(name)]:
+                del row[name]
+            yield row
+
+
+class TranslatableValuesListQuerySet(TranslatableValuesQuerySet, ValuesListQuerySet):
+    """
+    The ``values_list()`` result of a :class:`TranslatableQuerySet`.
+    """
+
+    def iterator(self):
+        if not any(_is_private_alias(name) for name in self.query.extra_select):
+            for row in ValuesListQuerySet.iterator(self):
+                yield row
+            return
+
+        # The extra columns are at the start of the row, pick the requested values by name.
+        names = list(self.query.extra_select) + self.field_names + list(self.query.aggregate_select)
+        if self._fields:
+            fields = list(self._fields) + [name for name in self.query.aggregate_select if name not in self._fields]
+        else:
+            fields = [name for name in names if not _is_private_alias(name)]
+
+        for row in self.query.get_compiler(self.db).results_iter():
+            data = dict(zip(names, row))
+            if self.flat and len(self._fields) == 1:
+                yield data[fields[0]]
+            else:
+                yield tuple([data[name] for name in fields])
+
+
 class TranslatableManager(models.Manager):
     """
     The manager class which ensures the enhanced TranslatableQuerySet object is used.
@@ -120,6 +548,180 @@ class TranslatableManager(models.Manager):
         """
         return self.get_query_set().active_translations(language_code)
 
+    def prefetch_translations(self, *lookups):
+        """
+        Fetch the translations of all retrieved objects in a single query.
+
+        When no language codes are given, the current language and fallback language of each object is fetched.
+        Relation paths can be given too, to fetch the translations of related objects.
+        """
+        return self.get_query_set().prefetch_translations(*lookups)
+
+    def batch_translations(self, enable=True):
+        """
+        Link all retrieved objects, so a missing translation is fetched for all objects at once.
+        """
+        return self.get_query_set().batch_translations(enable)
+
+    def annotate_translations(self, *names, **kwargs):
+        """
+        Add the translated fields as value to the query, using the fallback language when a translation is missing.
+        """
+        return self.get_query_set().annotate_translations(*names, **kwargs)
+
+    def order_by_translated(self, *field_names, **kwargs):
+        """
+        Order the results by translated fields, using the fallback language when a translation is missing.
+        """
+        return self.get_query_set().order_by_translated(*field_names, **kwargs)
+
+    def translated_values(self, *fields, **kwargs):
+        """
+        Iterate over the shared and translated field values as dictionaries, without constructing any model objects.
+        """
+        return self.get_query_set().translated_values(*fields, **kwargs)
+
+    def translated_values_list(self, *fields, **kwargs):
+        """
+        Iterate over the shared and translated field values as tuples, without constructing any model objects.
+        """
+        return self.get_query_set().translated_values_list(*fields, **kwargs)
+
+    def cached_get(self, pk, language_code=None):
+        """
+        Fetch an object by primary key, with its current and fallback translations from a single cache entry.
+
+        When the entry is missing, the object and translations are fetched from the database and stored in the cache.
+        The entry keeps the translations of all requested languages, so objects which are read in several languages share it.
+        The entry is removed when the object, or one of its translations is saved.
+        Changes made with ``QuerySet.update()`` or ``QuerySet.delete()`` don't remove the entry,
+        use :func:`~parler.cache.bump_cache_generation` after those.
+
+        The entry is only used by managers with the same queryset, so objects which are excluded
+        by the queryset of this manager (e.g. unpublished objects) are not returned.
+        Date and time values of the filters are not compared, so a filter on the current time
+        is only checked when the entry is stored.
+        """
+        language_code = normalize_language_code(language_code or get_language())
+        language_codes = [language_code] + get_fallback_languages(language_code)
+
+        queryset = self.get_query_set()
+        query_hash = _get_query_hash(queryset)
+        obj, cached_translations = _get_cached_object(self.model, pk, language_codes, using=self._db or router.db_for_read(self.model), query_hash=query_hash)
+        if obj is None:
+            obj = queryset.get(pk=pk)
+            prefetch_translations([obj], language_codes)
+            _cache_object(obj, language_codes, query_hash=query_hash, cached_translations=cached_translations, background=True)
+
+        obj.set_current_language(language_code)
+        return obj
+
+
+def _get_query_hash(queryset):
+    # Identify the filters of a queryset, used by cached_get().
+    # Date and time values are left out, so a filter on the current time (e.g. publication_date__lte=now())
+    # doesn't give a new hash on every call.
+    query = queryset.query.clone()
+    _replace_time_values(query.where)
+    return hashlib.md5(repr(query.sql_with_params())).hexdigest()[:8]
+
+
+def _replace_time_values(node):
+    # Replace the date and time values of a (cloned) where-tree with a fixed value of the same type.
+    for i, child in enumerate(node.children):
+        if isinstance(child, tuple) and len(child) == 4:
+            node.children[i] = child[:3] + (_get_fixed_time_value(child[3]),)
+        elif hasattr(child, 'children'):
+            _replace_time_values(child)
+        elif hasattr(child, 'params') and child.params:
+            child.params = _get_fixed_time_value(list(child.params))  # extra(where=..., params=...)
+
+
+def _get_fixed_time_value(value):
+    if isinstance(value, (list, tuple)):
+        return type(value)(_get_fixed_time_value(item) for item in value)
+    elif isinstance(value, datetime.datetime):
+        return value.replace(year=2000, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    elif isinstance(value, datetime.date):
+        return value.replace(year=2000, month=1, day=1)
+    elif isinstance(value, datetime.time):
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value
+
+
+def _get_related_objects(objects, path):
+    """
+    Collect the translatable objects at the end of a relation path.
+    """
+    for name in path.split('__'):
+        related = []
+        for obj in objects:
+            try:
+                value = getattr(obj, name)
+            except ObjectDoesNotExist:
+                continue
+
+            if isinstance(value, models.Manager):
+                related.extend(value.all())  # reads the prefetch_related() cache.
+            elif value is not None:
+                related.append(value)
+        objects = related
+
+    return [obj for obj in objects if getattr(obj, '_translations_model', None) is not None]
+
+
+def _get_annotation_alias(name):
+    # The column alias of annotate_translations() when model instances are fetched.
+    return '_parler_annotation_{0}'.format(name)
+
+
+def _get_ordering_alias(name):
+    # The column alias of order_by_translated().
+    return '_parler_ordering_{0}'.format(name)
+
+
+def _is_ordering_alias(name):
+    return name.startswith('_parler_ordering_')
+
+
+def _is_private_alias(name):
+    # The column aliases which are used internally, and not returned by values().
+    return name.startswith('_parler_')
+
+
+def _get_coalesced_column_sql(model, attname, num_languages, using):
+    """
+    Return the SQL to fetch the first translated value of a chain of languages.
+
+    Each language is a correlated subselect, as Django has no language-filtered LEFT JOIN.
+    That is only used for the fields which are requested explicitly, and for values which are
+    needed by the database itself (sorting and slicing), or without constructing model objects.
+    To read the translations of model objects, :func:`~parler.utils.prefetch_translations`
+    is cheaper, as it needs a single query for all languages and fields.
+    """
+    columns = [_get_translated_column_sql(model, attname, using)] * num_languages
+    if len(columns) == 1:
+        return columns[0]
+    return 'COALESCE({0})'.format(', '.join(columns))
+
+
+def _get_translated_column_sql(model, attname, using):
+    """
+    Return the SQL to fetch a translated column of the master row, the language code is a parameter.
+    """
+    qn = connections[using].ops.quote_name
+    translations_model = model._translations_model
+    columns = dict((field.attname, field.column) for field in translations_model._meta.fields)
+    return '(SELECT {alias}.{column} FROM {table} {alias} WHERE {alias}.{master} = {master_table}.{pk} AND {alias}.{language} = %s)'.format(
+        alias=qn('parler_translation'),
+        column=qn(columns[attname]),
+        table=qn(translations_model._meta.db_table),
+        master=qn(translations_model._meta.get_field('master').column),
+        master_table=qn(model._meta.db_table),
+        pk=qn(model._meta.pk.column),
+        language=qn(translations_model._meta.get_field('language_code').column),
+    )
+
 
 # Export the names in django-hvad style too:
 TranslationQueryset = TranslatableQuerySet
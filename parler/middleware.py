@@ -0,0 +1,42 @@
+"""
+Middleware for django-parler.
+"""
+from parler.cache import enable_request_cache, disable_request_cache, start_cache_writes, flush_cache_writes, discard_cache_writes
+
+
+class RequestCacheMiddleware(object):
+    """
+    Remember the cached translations during a request.
+
+    When the same object is constructed multiple times in a request (e.g. in the view, context processors and template tags),
+    the translations are only read once from the cache backend.
+    """
+
+    def process_request(self, request):
+        enable_request_cache()
+
+    def process_response(self, request, response):
+        disable_request_cache()
+        return response
+
+    def process_exception(self, request, exception):
+        disable_request_cache()
+
+
+class BatchCacheWritesMiddleware(object):
+    """
+    Send the cache writes of a request with a single ``set_many()`` and ``delete_many()`` call at the end.
+
+    When an exception occurs, the cached values are removed instead of updated.
+    Place this middleware before the ``TransactionMiddleware``, so the cache is updated after the commit.
+    """
+
+    def process_request(self, request):
+        start_cache_writes()
+
+    def process_response(self, request, response):
+        flush_cache_writes()
+        return response
+
+    def process_exception(self, request, exception):
+        discard_cache_writes()
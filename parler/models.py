@@ -16,11 +16,14 @@ from django.db.models.base import ModelBase
 from django.db.models.fields.related import ReverseSingleRelatedObjectDescriptor
 from django.utils.functional import lazy
 from django.utils.translation import get_language, ugettext
-from parler import signals
-from parler.cache import _cache_translation, _delete_cached_translation, get_cached_translation, _delete_cached_translations
-from parler.fields import TranslatedField, LanguageCodeDescriptor, TranslatedFieldDescriptor
+from parler import appsettings, signals
+from parler.cache import _cache_translation, _cache_missing_translation, _delete_cached_translation, get_cached_translation, _delete_cached_translations, \
+    get_cached_available_languages, _cache_available_languages, _delete_cached_available_languages, _get_cached_heavy_field, _cache_heavy_field, \
+    get_cached_translations, _refill_lock, _delete_cached_object, _cache_translation_bundles
+from parler.fields import TranslatedField, LanguageCodeDescriptor, TranslatedFieldDescriptor, HeavyFieldDescriptor
 from parler.managers import TranslatableManager
-from parler.utils.i18n import normalize_language_code, get_language_settings, get_language_title
+from parler.utils.i18n import normalize_language_code, get_language_title, get_fallback_languages
+from parler.utils.prefetch import prefetch_translations
 import sys
 import logging
 
@@ -40,13 +43,14 @@ class TranslationDoesNotExist(AttributeError):
 _lazy_verbose_name = lazy(lambda x: ugettext("{0} Translation").format(x._meta.verbose_name), unicode)
 
 
-def create_translations_model(shared_model, related_name, meta, **fields):
+def create_translations_model(shared_model, related_name, meta, heavy_fields=(), **fields):
     """
     Dynamically create the translations model.
     Create the translations model for the shared model 'model'.
 
     :param related_name: The related name for the reverse FK from the translations model.
     :param meta: A (optional) dictionary of attributes for the translations model's inner Meta class.
+    :param heavy_fields: The names of fields which are cached separately, see :attr:`TranslatedFieldsModel.heavy_fields`.
     :param fields: A dictionary of fields to put on the translations model.
 
     Two fields are enforced on the translations model:
@@ -73,6 +77,7 @@ def create_translations_model(shared_model, related_name, meta, **fields):
     attrs['Meta'] = type('Meta', (object,), meta)
     attrs['__module__'] = shared_model.__module__
     attrs['objects'] = models.Manager()
+    attrs['heavy_fields'] = tuple(heavy_fields)
     attrs['master'] = models.ForeignKey(shared_model, related_name=related_name, editable=False, null=True)
 
     # Create and return the new model
@@ -101,17 +106,21 @@ class TranslatedFields(object):
             translations = TranslatedFields(
                 title = models.CharField("Title", max_length=200)
             )
+
+    Large fields can be cached separately using ``heavy_fields=('content',)``,
+    see :attr:`TranslatedFieldsModel.heavy_fields`.
     """
-    def __init__(self, meta=None, **fields):
+    def __init__(self, meta=None, heavy_fields=(), **fields):
         self.fields = fields
         self.meta = meta
+        self.heavy_fields = heavy_fields
         self.name = None
 
     def contribute_to_class(self, cls, name):
         self.name = name
 
         # Called from django.db.models.base.ModelBase.__new__
-        translations_model = create_translations_model(cls, name, self.meta, **self.fields)
+        translations_model = create_translations_model(cls, name, self.meta, self.heavy_fields, **self.fields)
 
         # The metaclass (TranslatedFieldsModelBase) should configure this already:
         assert cls._translations_model == translations_model
@@ -128,6 +137,7 @@ class TranslatableModel(models.Model):
     # Not part of the public API, but used internally in the class hierarchy.
     _translations_field = None
     _translations_model = None
+    _translations_batch = None   # Other objects of the same result set, see TranslatableQuerySet.batch_translations()
 
     language_code = LanguageCodeDescriptor()
 
@@ -187,8 +197,15 @@ class TranslatableModel(models.Model):
         Return the fallback language code,
         which is used in case there is no translation for the currently active language.
         """
-        lang_dict = get_language_settings(self._current_language)
-        return lang_dict['fallback'] if lang_dict['fallback'] != self._current_language else None
+        fallbacks = self.get_fallback_languages()
+        return fallbacks[0] if fallbacks else None
+
+
+    def get_fallback_languages(self):
+        """
+        Return the chain of fallback language codes, in the order in which they are tried.
+        """
+        return get_fallback_languages(self._current_language)
 
 
     def has_translation(self, language_code=None):
@@ -204,6 +221,16 @@ class TranslatableModel(models.Model):
             # NOTE this may also return newly auto created translations which are not saved yet.
             return self._translations_cache[language_code] is not None
         except KeyError:
+            # The prefetch_related('translations') rows answer it without any cache queries.
+            prefetch = self._get_prefetched_translations()
+            if prefetch is not None:
+                return any(translation.language_code == language_code for translation in prefetch)
+
+            # Check the cached list of languages, avoids fetching the translation.
+            languages = get_cached_available_languages(self) if self.pk is not None else None
+            if languages is not None:
+                return language_code in languages
+
             try:
                 # Fetch from DB, fill the cache.
                 self._get_translated_model(language_code, use_fallback=False, auto_create=False)
@@ -217,7 +244,39 @@ class TranslatableModel(models.Model):
         """
         Return the language codes of all translated variations.
         """
-        return self._translations_model.objects.using(self._state.db).filter(master=self).values_list('language_code', flat=True).order_by('language_code')
+        prefetch = self._get_prefetched_translations()
+        if prefetch is not None:
+            return sorted(translation.language_code for translation in prefetch)
+
+        if self.pk is None:
+            return []
+
+        languages = get_cached_available_languages(self)
+        if languages is None and appsettings.PARLER_CACHE_BUNDLE:
+            # The bundle contains the list of languages, fetch all translations to store it.
+            translations = list(self._translations_model.objects.using(self._state.db).filter(master=self))
+            for translation in translations:
+                translation.master = self  # avoid a query when accessing the master.
+                self._translations_cache.setdefault(translation.language_code, translation)
+            _cache_translation_bundles(self._translations_model, [self.pk], translations, background=True)
+            languages = self._bundle_languages = sorted(translation.language_code for translation in translations)
+        elif languages is None:
+            languages = list(self._translations_model.objects.using(self._state.db).filter(master=self).values_list('language_code', flat=True).order_by('language_code'))
+            _cache_available_languages(self, languages, background=True)
+
+        return languages
+
+
+    def _get_prefetched_translations(self):
+        """
+        Return the translations which are fetched by ``prefetch_related('translations')``.
+        Returns None if the translations are not prefetched.
+        """
+        try:
+            # Read the prefetch cache directly, as the related manager would clone the queryset.
+            return self._prefetched_objects_cache[self._translations_field]
+        except (AttributeError, KeyError):
+            return None
 
 
     def _get_translated_model(self, language_code=None, use_fallback=False, auto_create=False):
@@ -239,25 +298,50 @@ class TranslatableModel(models.Model):
                 return object
         except KeyError:
             # 2. No cache, need to query
-            # Get via self.TRANSLATIONS_FIELD.get(..) so it also uses the prefetch/select_related cache.
             # Check that this object already exists, would be pointless otherwise to check for a translation.
-            if not self._state.adding:
-                # 2.1, fetch from memcache
+            prefetch = self._get_prefetched_translations()
+            if prefetch is not None:
+                # 2.0, use the prefetch_related('translations') cache.
+                # This contains all languages, so the result is also known when the language doesn't exist.
+                object = next((t for t in prefetch if t.language_code == language_code), None)
+                self._translations_cache[language_code] = object  # None is a marker that the language doesn't exist.
+                if object is not None:
+                    return object
+            elif self._translations_batch and not self._state.adding:
+                # 2.1, fetch the translations for all objects of the same result set at once.
+                prefetch_translations(self._translations_batch, [language_code] + get_fallback_languages(language_code))
+                object = self._translations_cache.get(language_code)
+                if object is not None:
+                    return object
+            elif (use_fallback or appsettings.PARLER_CACHE_BUNDLE) and not self._state.adding:
+                # 2.2, fetch the language and all fallback languages at once,
+                # using a single cache query and database query.
+                prefetch_translations([self], [language_code] + get_fallback_languages(language_code))
+                object = self._translations_cache.get(language_code)
+                if object is not None:
+                    return object
+            elif not self._state.adding:
+                # 2.3, fetch from memcache
                 object = get_cached_translation(self, language_code)
                 if object is not None:
                     # Track in local cache
                     self._translations_cache[language_code] = object
                     return object
-                else:
-                    # 2.2, fetch from database
-                    accessor = getattr(self, self._translations_field)
-                    try:
-                        object = accessor.get(language_code=language_code)
-                    except self._translations_model.DoesNotExist:
-                        pass
-                    else:
+                elif language_code not in self._translations_cache:  # skip when the cache has a missing marker.
+                    # 2.4, fetch from database, while other processes wait for the cache to be filled.
+                    with _refill_lock(self._translations_model, self.pk) as owner:
+                        object = None if owner else get_cached_translation(self, language_code)
+                        if object is None and language_code not in self._translations_cache:
+                            accessor = getattr(self, self._translations_field)
+                            try:
+                                object = accessor.get(language_code=language_code)
+                            except self._translations_model.DoesNotExist:
+                                _cache_missing_translation(self, language_code, background=True)
+                            else:
+                                _cache_translation(object, background=True)  # Store in memcached
+
+                    if object is not None:
                         self._translations_cache[language_code] = object
-                        _cache_translation(object)  # Store in memcached
                         return object
 
         # Not in cache, or default.
@@ -276,16 +360,19 @@ class TranslatableModel(models.Model):
 
         # 4. Fallback?
         fallback_msg = None
-        lang_dict = get_language_settings(language_code)
+        fallbacks = get_fallback_languages(language_code) if use_fallback else None
 
-        if use_fallback and (lang_dict['fallback'] != language_code):
-            # Jump to fallback language, return directly.
+        if fallbacks:
+            # Jump to the fallback languages, return directly.
             # Don't cache under this language_code
             self._translations_cache[language_code] = None   # explicit marker that language query was tried before.
-            try:
-                return self._get_translated_model(lang_dict['fallback'], use_fallback=False, auto_create=auto_create)
-            except self._translations_model.DoesNotExist:
-                fallback_msg = u" (tried fallback {0})".format(lang_dict['fallback'])
+            for fallback in fallbacks:
+                try:
+                    return self._get_translated_model(fallback, use_fallback=False, auto_create=auto_create)
+                except self._translations_model.DoesNotExist:
+                    pass
+
+            fallback_msg = u" (tried fallback {0})".format(u', '.join(fallbacks))
 
         # None of the above, bail out!
         raise self._translations_model.DoesNotExist(
@@ -304,24 +391,58 @@ class TranslatableModel(models.Model):
             # Give consistent answers if they exist.
             try:
                 return self._translations_cache.get(self._current_language, None) \
-                    or self._translations_cache.get(self.get_fallback_language(), None) \
+                    or next((self._translations_cache[code] for code in self.get_fallback_languages() if self._translations_cache.get(code) is not None), None) \
                     or next(t for t in self._translations_cache.itervalues() if t if not None)  # Skip fallback markers.
             except StopIteration:
                 pass
 
-        try:
-            translation = self._translations_model.objects.using(self._state.db).filter(master=self)[0]
-        except IndexError:
-            return None
-        else:
-            self._translations_cache[translation.language_code] = translation
-            _cache_translation(translation)
+        prefetch = self._get_prefetched_translations()
+        if prefetch is not None:
+            # All translations are known already, no need for queries.
+            translation = next(iter(prefetch), None)
+            if translation is not None:
+                self._translations_cache[translation.language_code] = translation
             return translation
 
+        if appsettings.PARLER_CACHE_BUNDLE and not self._state.adding:
+            # The cache entry contains all languages, fetch it from the cache or database.
+            prefetch_translations([self], [self._current_language])
+            return next((t for t in self._translations_cache.itervalues() if t is not None), None)
+
+        with _refill_lock(self._translations_model, self.pk) as owner:
+            if not owner:
+                # Another process fetched the translations, check the cache for the preferred languages.
+                language_codes = [self._current_language] + self.get_fallback_languages()
+                found = dict((t.language_code, t) for t in get_cached_translations([(self, code) for code in language_codes]))
+                translation = next((found[code] for code in language_codes if code in found), None)
+                if translation is not None:
+                    self._translations_cache[translation.language_code] = translation
+                    return translation
+
+            try:
+                translation = self._translations_model.objects.using(self._state.db).filter(master=self)[0]
+            except IndexError:
+                return None
+            else:
+                self._translations_cache[translation.language_code] = translation
+                _cache_translation(translation, background=True)
+                return translation
+
+
+    def __reduce__(self):
+        # Avoid pickling all other objects of the result set.
+        reduced = super(TranslatableModel, self).__reduce__()
+        if '_translations_batch' in reduced[2]:
+            data = reduced[2].copy()
+            del data['_translations_batch']
+            reduced = reduced[:2] + (data,) + reduced[3:]
+        return reduced
+
 
     def save(self, *args, **kwargs):
         super(TranslatableModel, self).save(*args, **kwargs)
         self.save_translations(*args, **kwargs)
+        _delete_cached_object(self)  # The shared fields are cached by TranslatableManager.cached_get()
 
 
     def delete(self, using=None):
@@ -429,11 +550,16 @@ def _validate_master(new_class):
 class TranslatedFieldsModel(models.Model):
     """
     Base class for the model that holds the translated fields.
+
+    The names in ``heavy_fields`` are cached under a separate key, and loaded on first access.
+    This keeps large fields (e.g. the HTML contents) out of the cached translation,
+    which is all that list pages typically need.
     """
     __metaclass__ = TranslatedFieldsModelBase
 
     language_code = models.CharField(max_length=15, db_index=True)
     master = None   # FK to shared model.
+    heavy_fields = ()
 
     class Meta:
         abstract = True
@@ -449,6 +575,28 @@ class TranslatedFieldsModel(models.Model):
     def is_modified(self):
         return self._original_values != self._get_field_values()
 
+    def _load_heavy_field(self, attname):
+        """
+        Load a heavy field, which was not part of the cached translation.
+        """
+        values = _get_cached_heavy_field(self, attname)
+        if values is not None:
+            value = values[0]
+        else:
+            value = self.__class__._default_manager.using(self._state.db).values_list(attname, flat=True).get(pk=self.pk)
+            _cache_heavy_field(self, attname, value, background=True)
+
+        # The field is loaded now, so it's not seen as modified.
+        self.__dict__[attname] = value
+        self._original_values[self._get_field_attnames().index(attname)] = value
+        return value
+
+    def _unload_heavy_fields(self):
+        # Remove the default values of the heavy fields, so they are loaded on first access.
+        for attname in self.get_heavy_field_attnames():
+            self.__dict__.pop(attname, None)
+        self._original_values = self._get_field_values()
+
     @property
     def is_empty(self):
         return len(self.get_translated_fields()) == 0
@@ -470,7 +618,8 @@ class TranslatedFieldsModel(models.Model):
         # Perform save
         super(TranslatedFieldsModel, self).save_base(raw=raw, using=using, **kwargs)
         self._original_values = self._get_field_values()
-        _cache_translation(self)
+        _cache_translation(self)  # This also replaces the missing marker of a new translation.
+        _delete_cached_available_languages(self, created=not record_exists)
 
         # Send the post_save signal
         if not self._meta.auto_created:
@@ -494,7 +643,19 @@ class TranslatedFieldsModel(models.Model):
 
     def _get_field_values(self):
         # Return all field values in a consistent (sorted) manner.
-        return [getattr(self, field.get_attname()) for field, _ in self._meta.get_fields_with_model()]
+        # Heavy fields which are not loaded yet are not modified either.
+        return [self.__dict__.get(attname, HeavyFieldDescriptor.NOT_LOADED) for attname in self._get_field_attnames()]
+
+    @classmethod
+    def _get_field_attnames(cls):
+        return [field.get_attname() for field, _ in cls._meta.get_fields_with_model()]
+
+    @classmethod
+    def get_heavy_field_attnames(cls):
+        """
+        Return the attribute names of the heavy fields.
+        """
+        return [cls._meta.get_field(name).attname for name in cls.heavy_fields]
 
     @classmethod
     def get_translated_fields(cls):
@@ -510,8 +671,16 @@ class TranslatedFieldsModel(models.Model):
         shared_model._translations_model = cls
         shared_model._translations_field = cls.master.field.rel.related_name
 
+        # Heavy fields are loaded on first access when the translation was read from the cache.
+        translated_fields = cls.get_translated_fields()
+        for name in cls.heavy_fields:
+            if name not in translated_fields:
+                raise TypeError("The heavy field '{0}' is not a field of '{1}'".format(name, cls.__name__))
+            attname = cls._meta.get_field(name).attname
+            setattr(cls, attname, HeavyFieldDescriptor(attname))
+
         # Assign the proxy fields
-        for name in cls.get_translated_fields():
+        for name in translated_fields:
             try:
                 # Check if the field already exists.
                 # Note that the descriptor even proxies this request, so it should return our field.
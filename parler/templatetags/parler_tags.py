@@ -1,6 +1,7 @@
 from django.template import Node, Library, TemplateSyntaxError
 from django.utils.translation import get_language
 from parler.models import TranslatableModel
+from parler.utils import prefetch_translations
 
 register = Library()
 
@@ -61,3 +62,22 @@ def objectlanguage(parser, token):
     nodelist = parser.parse(('endobjectlanguage',))
     parser.delete_first_token()
     return ObjectLanguageNode(nodelist, object_var, language_var)
+
+
+@register.simple_tag(name='prefetch_translations')
+def prefetch_translations_tag(object_list, *language_codes):
+    """
+    Template tag to fetch the translations of all objects in a list at once.
+    Example::
+
+        {% prefetch_translations object_list %}
+        {% for object in object_list %}
+          {{ object.title }}
+        {% endfor %}
+
+    This avoids a query for every object when the list is not a queryset,
+    e.g. a list of search results or objects collected from several relations.
+    Optionally, the languages to fetch can be given as extra arguments.
+    """
+    prefetch_translations([obj for obj in object_list if isinstance(obj, TranslatableModel)], language_codes)
+    return u''
@@ -1,3 +1,4 @@
 from .model_construction import *
 from .model_attributes import *
 from .forms import *
+from .query_count import *
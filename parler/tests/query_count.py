@@ -0,0 +1,978 @@
+import copy
+import datetime
+import pickle
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.fields import FieldDoesNotExist
+from django.core.management import call_command
+from django.template import Template, Context
+from django.utils import translation
+from parler import appsettings
+from parler.cache import get_translation_cache_key, get_translation_bundle_cache_key, get_translated_field_cache_key, bump_cache_generation, get_request_cache_stats, LocalCache, \
+    get_cached_translated_field, get_compression_stats, reset_compression_stats, _local_cache, _generations, _get_version_cache_key, _get_changes_cache_key, _get_generation_cache_key, \
+    batch_cache_writes, flush_write_behind, get_write_behind_stats, get_cache_breaker_state, CircuitBreaker, _cache_translation, _cache_available_languages, \
+    _cache_missing_translation, _cache_missing_translations
+from parler.managers import TranslatableManager
+from parler.middleware import RequestCacheMiddleware, BatchCacheWritesMiddleware
+from parler.utils import prefetch_translations
+from .utils import AppTestCase
+from .testapp.models import SimpleModel, AnyLanguageModel, CategoryModel, TagModel, ProductModel, ArticleModel
+
+
+class QueryCountTests(AppTestCase):
+    """
+    Test the number of queries performed to read the translated fields.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(QueryCountTests, cls).setUpClass()
+        cls.conf_fallback = appsettings.PARLER_LANGUAGES['default']['fallback'] or 'en'
+
+
+    def setUp(self):
+        super(QueryCountTests, self).setUp()
+        for i in range(3):
+            x = SimpleModel()
+            x.set_current_language(self.conf_fallback)
+            x.tr_title = "TITLE_{0}".format(i)
+            x.save()
+
+
+    def test_prefetch_translations(self):
+        """
+        Test whether prefetch_translations() fetches all translations in a single query.
+        """
+        with translation.override('nl'):
+            qs = SimpleModel.objects.prefetch_translations()
+            with self.assertNumQueries(2):   # objects + translations
+                objects = list(qs)
+
+            def read_titles():
+                self.assertEqual(sorted(x.tr_title for x in objects), ['TITLE_0', 'TITLE_1', 'TITLE_2'])
+                self.assertFalse(any(x.has_translation('nl') for x in objects))
+
+            self.assertNumQueries(0, read_titles)
+
+
+    def test_prefetch_translations_languages(self):
+        """
+        Test whether prefetch_translations() only fetches the given languages.
+        """
+        qs = SimpleModel.objects.language('nl').prefetch_translations('nl')
+        with self.assertNumQueries(2):
+            objects = list(qs)
+
+        self.assertEqual(objects[0].get_current_language(), 'nl')
+        self.assertEqual(objects[0]._translations_cache, {'nl': None})
+
+
+    def test_prefetch_related(self):
+        """
+        Test whether the translations of prefetch_related() are used.
+        """
+        with translation.override('nl'):
+            with self.assertNumQueries(2):
+                objects = list(SimpleModel.objects.prefetch_related('translations'))
+
+            def read_titles():
+                self.assertEqual(sorted(x.tr_title for x in objects), ['TITLE_0', 'TITLE_1', 'TITLE_2'])
+                self.assertFalse(objects[0].has_translation('nl'))
+                self.assertEqual(list(objects[0].get_available_languages()), [self.conf_fallback])
+                self.assertEqual(objects[1]._get_any_translated_model().language_code, self.conf_fallback)
+
+            self.assertNumQueries(0, read_titles)
+
+            # Checking a language doesn't read the cache either.
+            from parler import cache as parler_cache
+            class CountingCache(object):
+                calls = 0
+                def __getattr__(self, name):
+                    CountingCache.calls += 1
+                    return getattr(cache, name)
+
+            objects = list(SimpleModel.objects.prefetch_related('translations'))
+            parler_cache.cache = CountingCache()
+            try:
+                self.assertFalse(objects[0].has_translation('nl'))
+                self.assertTrue(objects[0].has_translation(self.conf_fallback))
+            finally:
+                parler_cache.cache = cache
+            self.assertEqual(CountingCache.calls, 0)
+
+
+    def test_batch_translations(self):
+        """
+        Test whether a missing translation is fetched for all objects of the result set at once.
+        """
+        with translation.override('nl'):
+            with self.assertNumQueries(1):
+                objects = list(SimpleModel.objects.batch_translations())
+
+            with self.assertNumQueries(1):
+                self.assertEqual(sorted(x.tr_title for x in objects), ['TITLE_0', 'TITLE_1', 'TITLE_2'])
+
+            # The other objects of the result set are not pickled.
+            self.assertIsNone(pickle.loads(pickle.dumps(objects[0]))._translations_batch)
+
+
+    def test_prefetch_translations_list(self):
+        """
+        Test whether the translations of different models can be fetched at once.
+        """
+        x = AnyLanguageModel()
+        x.set_current_language(self.conf_fallback)
+        x.tr_title = "ANY_TITLE"
+        x.save()
+
+        with translation.override('nl'):
+            objects = list(SimpleModel.objects.all()) + list(AnyLanguageModel.objects.all())
+            with self.assertNumQueries(2):   # one query per translations model.
+                prefetch_translations(objects)
+
+            def read_titles():
+                self.assertEqual(sorted(x.tr_title for x in objects), ['ANY_TITLE', 'TITLE_0', 'TITLE_1', 'TITLE_2'])
+
+            self.assertNumQueries(0, read_titles)
+
+
+    def test_prefetch_translations_tag(self):
+        """
+        Test whether the {% prefetch_translations %} tag fetches all translations.
+        """
+        objects = list(SimpleModel.objects.all())
+        template = Template('{% load parler_tags %}{% prefetch_translations objects "nl" %}')
+        with self.assertNumQueries(1):
+            template.render(Context({'objects': objects}))
+
+        self.assertNumQueries(0, lambda: objects[0].has_translation('nl'))
+
+
+    def test_prefetch_translations_related(self):
+        """
+        Test whether prefetch_translations() fetches the translations of related objects.
+        """
+        parent = CategoryModel.objects.create(tr_title='PARENT', _current_language='nl')
+        category = CategoryModel.objects.create(parent=parent, tr_title='CATEGORY', _current_language='nl')
+        tags = [TagModel.objects.create(tr_title='TAG_{0}'.format(i), _current_language='nl') for i in range(2)]
+        for i in range(3):
+            product = ProductModel.objects.create(category=category, tr_title='PRODUCT_{0}'.format(i), _current_language='nl')
+            product.tags = tags
+
+        qs = ProductModel.objects.language('nl').prefetch_translations('category', 'tags', 'category__parent')
+        with self.assertNumQueries(8):   # 2 queries for products, categories, tags and parents.
+            products = list(qs)
+
+        def read_titles():
+            for product in products:
+                self.assertEqual(product.category.get_current_language(), 'nl')
+                self.assertEqual(product.category.tr_title, 'CATEGORY')
+                self.assertEqual(product.category.parent.tr_title, 'PARENT')
+                self.assertEqual(sorted(tag.tr_title for tag in product.tags.all()), ['TAG_0', 'TAG_1'])
+
+        self.assertNumQueries(0, read_titles)
+
+        # A typing error is not mistaken for a language code.
+        self.assertRaises(FieldDoesNotExist, ProductModel.objects.prefetch_translations, 'categroy')
+        self.assertRaises(FieldDoesNotExist, ProductModel.objects.prefetch_translations, 'category__parnt')
+
+
+    def test_fallback_chain(self):
+        """
+        Test whether a chain of fallback languages is fetched in a single query.
+        """
+        old_languages = appsettings.PARLER_LANGUAGES
+        appsettings.PARLER_LANGUAGES = appsettings.add_default_language_settings({
+            settings.SITE_ID: (
+                {'code': 'de', 'fallbacks': ['nl', self.conf_fallback]},
+                {'code': 'nl'},
+            ),
+            'default': {
+                'fallback': self.conf_fallback,
+            },
+        })
+        try:
+            self.assertEqual(appsettings.PARLER_LANGUAGES.get_language('de')['fallback'], 'nl')
+            self.assertEqual(appsettings.PARLER_LANGUAGES.get_active_choices('de'), ('de', 'nl', self.conf_fallback))
+
+            x = SimpleModel.objects.language('de').get(translations__tr_title='TITLE_0')
+            self.assertEqual(x.get_fallback_languages(), ['nl', self.conf_fallback])
+            self.assertNumQueries(1, lambda: x.tr_title)
+            self.assertEqual(x.tr_title, 'TITLE_0')
+            self.assertEqual(sorted(x._translations_cache.keys()), sorted(['de', 'nl', self.conf_fallback]))
+            self.assertIsNone(x._translations_cache['nl'])
+        finally:
+            appsettings.PARLER_LANGUAGES = old_languages
+
+
+    def test_missing_translation_cached(self):
+        """
+        Test whether a missing translation is remembered in the cache.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        x = SimpleModel.objects.get(pk=pk)
+        self.assertNumQueries(1, lambda: x.has_translation('nl'))
+        self.assertFalse(x.has_translation('nl'))
+
+        # Other instances know the translation is missing
+        x = SimpleModel.objects.get(pk=pk)
+        self.assertNumQueries(0, lambda: x.has_translation('nl'))
+        self.assertFalse(x.has_translation('nl'))
+
+        # Creating the translation clears the marker.
+        x.set_current_language('nl')
+        x.tr_title = 'TITLE_NL'
+        x.save()
+        self.assertTrue(SimpleModel.objects.get(pk=pk).has_translation('nl'))
+
+        # A reader which missed the translation before it was saved can't store the marker again.
+        key = get_translation_cache_key(SimpleModel._translations_model, pk, 'nl')
+        _cache_missing_translation(x, 'nl')
+        self.assertEqual(cache.get(key)[1], 'TITLE_NL')
+
+        threads = appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS
+        appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS = 1
+        try:
+            _cache_missing_translations([(x, 'nl')], background=True)
+            flush_write_behind()
+        finally:
+            appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS = threads
+        self.assertEqual(cache.get(key)[1], 'TITLE_NL')
+
+
+    def test_available_languages_cached(self):
+        """
+        Test whether the available languages are cached.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        cache.clear()   # remove the invalidated marker of the created translations.
+        x = SimpleModel.objects.get(pk=pk)
+        self.assertNumQueries(1, lambda: x.get_available_languages())
+
+        x = SimpleModel.objects.get(pk=pk)
+        self.assertNumQueries(0, lambda: x.get_available_languages())
+        self.assertNumQueries(0, lambda: x.has_translation('nl'))
+        self.assertEqual(x.get_available_languages(), [self.conf_fallback])
+        self.assertFalse(x.has_translation('nl'))
+
+        # Changing an existing translation keeps the list.
+        x.tr_title = 'TITLE_CHANGED'
+        x.save()
+        x = SimpleModel.objects.get(pk=pk)
+        self.assertNumQueries(0, lambda: x.get_available_languages())
+
+        # Adding a translation updates the list.
+        x.set_current_language('nl')
+        x.tr_title = 'TITLE_NL'
+        x.save()
+        self.assertEqual(sorted(SimpleModel.objects.get(pk=pk).get_available_languages()), sorted([self.conf_fallback, 'nl']))
+
+        # A reader which fetched the list before the save can't store the outdated list.
+        _cache_available_languages(x, [self.conf_fallback])
+        self.assertEqual(sorted(SimpleModel.objects.get(pk=pk).get_available_languages()), sorted([self.conf_fallback, 'nl']))
+
+
+    def test_cache_bundle(self):
+        """
+        Test whether the bundle layout answers all lookups from a single cache entry.
+        """
+        old_bundle = appsettings.PARLER_CACHE_BUNDLE
+        appsettings.PARLER_CACHE_BUNDLE = True
+        try:
+            pk = SimpleModel.objects.all()[0].pk
+            x = SimpleModel.objects.language('nl').get(pk=pk)
+            self.assertNumQueries(1, lambda: x.tr_title)   # all languages in one query.
+
+            def read_values():
+                x = SimpleModel.objects.language('nl').get(pk=pk)
+                self.assertEqual(x.tr_title, 'TITLE_0')
+                self.assertFalse(x.has_translation('de'))
+                self.assertEqual(x.get_available_languages(), [self.conf_fallback])
+                self.assertEqual(x._get_any_translated_model().language_code, self.conf_fallback)
+
+            self.assertNumQueries(1, read_values)   # only the master object.
+
+            # The list of languages also fills the bundle.
+            cache.clear()
+            x = SimpleModel.objects.get(pk=pk)
+            self.assertNumQueries(1, lambda: x.get_available_languages())
+            x = SimpleModel.objects.get(pk=pk)
+            self.assertNumQueries(0, lambda: x.get_available_languages())
+            self.assertNumQueries(0, lambda: x.tr_title)
+
+            # Saving a translation invalidates the bundle
+            x = SimpleModel.objects.language('nl').get(pk=pk)
+            x.tr_title = 'TITLE_NL'
+            x.save()
+            self.assertEqual(SimpleModel.objects.language('nl').get(pk=pk).tr_title, 'TITLE_NL')
+        finally:
+            appsettings.PARLER_CACHE_BUNDLE = old_bundle
+
+
+    def test_cache_generation(self):
+        """
+        Test whether bumping the generation makes all cached translations unreachable.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        SimpleModel.objects.get(pk=pk).tr_title   # fills the cache
+        x = SimpleModel.objects.get(pk=pk)
+        self.assertNumQueries(0, lambda: x.tr_title)
+
+        key = get_translation_cache_key(SimpleModel._translations_model, pk, self.conf_fallback)
+        bump_cache_generation(SimpleModel)
+        self.assertNotEqual(get_translation_cache_key(SimpleModel._translations_model, pk, self.conf_fallback), key)
+
+        x = SimpleModel.objects.get(pk=pk)
+        self.assertNumQueries(1, lambda: x.tr_title)
+
+        # The management command does the same.
+        call_command('parler_invalidate_cache', 'testapp.SimpleModel', verbosity=0)
+        x = SimpleModel.objects.get(pk=pk)
+        self.assertNumQueries(1, lambda: x.tr_title)
+
+
+    def test_request_cache(self):
+        """
+        Test whether repeated lookups in a request are served by the request cache.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        middleware = RequestCacheMiddleware()
+        middleware.process_request(None)
+        try:
+            self.assertEqual(SimpleModel.objects.get(pk=pk).tr_title, 'TITLE_0')   # miss, stores the value.
+            for i in range(3):
+                x = SimpleModel.objects.get(pk=pk)
+                self.assertNumQueries(0, lambda: x.tr_title)
+        finally:
+            middleware.process_response(None, None)
+
+        self.assertEqual(get_request_cache_stats(), {'hits': 3, 'misses': 1})
+
+
+    def test_local_cache(self):
+        """
+        Test whether the in-process cache answers lookups, and notices changes of other processes.
+        """
+        old_max_entries = appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES
+        appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES = 100
+        try:
+            pk = SimpleModel.objects.all()[0].pk
+            SimpleModel.objects.get(pk=pk).tr_title   # fills the cache
+            cache.clear()  # only the local cache remains.
+
+            x = SimpleModel.objects.get(pk=pk)
+            self.assertNumQueries(0, lambda: x.tr_title)
+
+            # Saving in this process updates the local entries.
+            x.tr_title = 'TITLE_CHANGED'
+            x.save()
+            self.assertEqual(SimpleModel.objects.get(pk=pk).tr_title, 'TITLE_CHANGED')
+
+            # A change of another object in another process only removes that object.
+            translated_model = SimpleModel._translations_model
+            version_key = _get_version_cache_key(translated_model)
+            other_pk = SimpleModel.objects.exclude(pk=pk)[0].pk
+            SimpleModel.objects.get(pk=other_pk).tr_title   # fills the cache
+            cache.delete_many([get_translation_cache_key(translated_model, id, self.conf_fallback) for id in (pk, other_pk)])
+            version = cache.incr(version_key)
+            cache.set(_get_changes_cache_key(translated_model, version), [other_pk])
+            cache.set(_get_generation_cache_key(translated_model), _generations[translated_model][0])   # removed by clear()
+            _generations.clear()
+            x = SimpleModel.objects.get(pk=pk)
+            self.assertNumQueries(0, lambda: x.tr_title)
+            y = SimpleModel.objects.get(pk=other_pk)
+            self.assertNumQueries(1, lambda: y.tr_title)
+
+            # Within a batch, the change is published with the queued writes.
+            with batch_cache_writes():
+                x.tr_title = 'TITLE_BATCH'
+                x.save()
+                self.assertEqual(cache.get(version_key), version)
+            self.assertEqual(cache.get(version_key), version + 1)
+            self.assertEqual(cache.get(_get_changes_cache_key(translated_model, version + 1)), [pk])
+
+            # Saving the shared fields is published too, as cached_get() stores them.
+            x.shared = 'SHARED_CHANGED'
+            x.save()
+            self.assertEqual(cache.get(version_key), version + 2)
+            self.assertEqual(cache.get(_get_changes_cache_key(translated_model, version + 2)), [pk])
+
+            # A change in another process is noticed at the next version check.
+            cache.delete(get_translation_cache_key(translated_model, pk, self.conf_fallback))
+            cache.incr(version_key)
+            _generations.clear()
+            x = SimpleModel.objects.get(pk=pk)
+            self.assertNumQueries(1, lambda: x.tr_title)
+        finally:
+            appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES = old_max_entries
+            _local_cache.clear()
+
+
+    def test_local_cache_size(self):
+        """
+        Test whether the in-process cache removes the least recently used entries.
+        """
+        old_max_entries = appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES
+        appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES = 2
+        try:
+            local_cache = LocalCache()
+            local_cache.set_many({'a': 1, 'b': 2})
+            local_cache.get_many(['a'])
+            local_cache.set_many({'c': 3})
+            self.assertEqual(local_cache.get_many(['a', 'b', 'c']), {'a': 1, 'c': 3})
+        finally:
+            appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES = old_max_entries
+
+
+    def test_cached_values(self):
+        """
+        Test whether the translations are cached as compact tuple.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        x = SimpleModel.objects.get(pk=pk)
+        x.tr_title   # fills the cache
+
+        key = get_translation_cache_key(SimpleModel._translations_model, pk, self.conf_fallback)
+        self.assertEqual(cache.get(key), (x._get_translated_model().pk, 'TITLE_0'))
+        self.assertEqual(get_cached_translated_field(x, self.conf_fallback, 'tr_title'), 'TITLE_0')
+
+
+    def test_cache_timeout(self):
+        """
+        Test whether the ``PARLER_CACHE_TIMEOUT`` setting is used for the cached translations.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        key = get_translation_cache_key(SimpleModel._translations_model, pk, self.conf_fallback)
+        old_timeout = appsettings.PARLER_CACHE_TIMEOUT
+        appsettings.PARLER_CACHE_TIMEOUT = 5000
+        try:
+            cache.clear()
+            SimpleModel.objects.get(pk=pk).tr_title   # fills the cache
+            self.assertAlmostEqual(cache._expire_info[cache.make_key(key)], time.time() + 5000, delta=10)
+        finally:
+            appsettings.PARLER_CACHE_TIMEOUT = old_timeout
+
+
+    def test_compressed_values(self):
+        """
+        Test whether large values are compressed in the cache, and read back transparently.
+        """
+        old_min_size = appsettings.PARLER_CACHE_COMPRESS_MIN_SIZE
+        old_max_entries = appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES
+        appsettings.PARLER_CACHE_COMPRESS_MIN_SIZE = 100
+        reset_compression_stats()
+        try:
+            title = 'LONG_TITLE ' * 15
+            x = SimpleModel(tr_title=title, _current_language=self.conf_fallback)
+            x.save()
+
+            key = get_translation_cache_key(SimpleModel._translations_model, x.pk, self.conf_fallback)
+            self.assertEqual(cache.get(key)[0], '__zlib__')
+
+            x = SimpleModel.objects.get(pk=x.pk)
+            self.assertNumQueries(0, lambda: x.tr_title)
+            self.assertEqual(x.tr_title, title)
+
+            stats = get_compression_stats()
+            self.assertEqual((stats['compressed'], stats['decompressed']), (1, 1))
+            self.assertTrue(stats['ratio'] < 0.5)
+
+            # The local cache keeps the decompressed values.
+            appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES = 100
+            for i in range(2):
+                x = SimpleModel.objects.get(pk=x.pk)
+                self.assertEqual(x.tr_title, title)
+            self.assertEqual(get_compression_stats()['decompressed'], 2)
+            self.assertEqual(cache.get(key)[0], '__zlib__')
+        finally:
+            appsettings.PARLER_CACHE_COMPRESS_MIN_SIZE = old_min_size
+            appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES = old_max_entries
+            _local_cache.clear()
+
+
+    def test_heavy_fields(self):
+        """
+        Test whether heavy fields are cached separately, and loaded on first access.
+        """
+        x = ArticleModel(tr_title='TITLE', tr_content='CONTENT', _current_language=self.conf_fallback)
+        x.save()
+
+        key = get_translation_cache_key(ArticleModel._translations_model, x.pk, self.conf_fallback)
+        self.assertEqual(len(cache.get(key)), 2)   # id and title only.
+
+        x = ArticleModel.objects.get(pk=x.pk)
+        self.assertNumQueries(0, lambda: x.tr_title)
+        self.assertNumQueries(0, lambda: x.tr_content)   # separate cache entry.
+        self.assertEqual(x.tr_content, 'CONTENT')
+
+        # Without the separate entry, the field is read from the database.
+        cache.delete(get_translated_field_cache_key(ArticleModel._translations_model, x.pk, self.conf_fallback, 'tr_content'))
+        x = ArticleModel.objects.get(pk=x.pk)
+        self.assertEqual(x.tr_title, 'TITLE')
+        self.assertNumQueries(1, lambda: x.tr_content)
+        self.assertFalse(x._get_translated_model().is_modified)
+
+        # A pickled or copied translation doesn't report the fields which are not loaded as modified.
+        x = ArticleModel.objects.get(pk=x.pk)
+        x.tr_title
+        for y in (pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)), pickle.loads(pickle.dumps(x)), copy.deepcopy(x)):
+            self.assertFalse(y._get_translated_model().is_modified)
+            self.assertNumQueries(1, y.save)   # only the master object is updated.
+
+        # Fetching the translations for a list doesn't cache the heavy fields.
+        heavy_key = get_translated_field_cache_key(ArticleModel._translations_model, x.pk, self.conf_fallback, 'tr_content')
+        cache.clear()
+        self.assertEqual([obj.tr_title for obj in ArticleModel.objects.prefetch_translations(self.conf_fallback)], ['TITLE'])
+        self.assertIsNone(cache.get(heavy_key))
+        ArticleModel.objects.get(pk=x.pk).tr_title
+        self.assertIsNone(cache.get(heavy_key))
+
+        # Saving other fields keeps the heavy field.
+        x = ArticleModel.objects.get(pk=x.pk)
+        x.tr_title = 'TITLE2'
+        x.save()
+        self.assertEqual(ArticleModel._translations_model.objects.get(master=x).tr_content, 'CONTENT')
+
+
+    def test_refill_lock(self):
+        """
+        Test whether a process waits for another process that fills the cache.
+        """
+        old_lock_timeout = appsettings.PARLER_CACHE_LOCK_TIMEOUT
+        appsettings.PARLER_CACHE_LOCK_TIMEOUT = 10
+        try:
+            pk = SimpleModel.objects.all()[0].pk
+            translation = SimpleModel.objects.get(pk=pk)._get_translated_model(self.conf_fallback)
+            cache.clear()
+
+            # Another process holds the lock, and fills the cache.
+            lock_key = get_translation_bundle_cache_key(SimpleModel._translations_model, pk) + '.lock'
+            cache.add(lock_key, 1)
+            def fill_cache():
+                time.sleep(0.1)
+                _cache_translation(translation)
+                cache.delete(lock_key)
+
+            thread = threading.Thread(target=fill_cache)
+            thread.start()
+            x = SimpleModel.objects.get(pk=pk)
+            self.assertNumQueries(0, lambda: x.tr_title)
+            thread.join()
+            self.assertEqual(x.tr_title, 'TITLE_0')
+        finally:
+            appsettings.PARLER_CACHE_LOCK_TIMEOUT = old_lock_timeout
+
+
+    def test_refill_lock_writes(self):
+        """
+        Test whether the lock owner stores the values before the lock is released.
+        """
+        old_lock_timeout = appsettings.PARLER_CACHE_LOCK_TIMEOUT
+        threads = appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS
+        appsettings.PARLER_CACHE_LOCK_TIMEOUT = 10
+        appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS = 1
+        try:
+            pk = SimpleModel.objects.all()[0].pk
+            key = get_translation_cache_key(SimpleModel._translations_model, pk, self.conf_fallback)
+
+            # Not delayed by the background threads.
+            cache.clear()
+            SimpleModel.objects.get(pk=pk).tr_title
+            self.assertEqual(cache.get(key)[1], 'TITLE_0')
+
+            # Not delayed until the end of the batch either.
+            cache.clear()
+            with batch_cache_writes():
+                SimpleModel.objects.get(pk=pk).tr_title
+                self.assertEqual(cache.get(key)[1], 'TITLE_0')
+        finally:
+            appsettings.PARLER_CACHE_LOCK_TIMEOUT = old_lock_timeout
+            appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS = threads
+
+
+    def test_early_refresh(self):
+        """
+        Test whether entries are fetched again when the refresh window reaches the expire time.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        old_early_refresh = appsettings.PARLER_CACHE_EARLY_REFRESH
+        try:
+            appsettings.PARLER_CACHE_EARLY_REFRESH = 0.001
+            cache.clear()
+            SimpleModel.objects.get(pk=pk).tr_title   # fills the cache, including the expire time.
+            x = SimpleModel.objects.get(pk=pk)
+            self.assertNumQueries(0, lambda: x.tr_title)
+
+            appsettings.PARLER_CACHE_EARLY_REFRESH = 1e9   # always within the window.
+            x = SimpleModel.objects.get(pk=pk)
+            self.assertNumQueries(1, lambda: x.tr_title)
+        finally:
+            appsettings.PARLER_CACHE_EARLY_REFRESH = old_early_refresh
+
+
+    def test_batch_cache_writes(self):
+        """
+        Test whether cache writes are sent at the end of the block, and dropped on errors.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        key = get_translation_cache_key(SimpleModel._translations_model, pk, self.conf_fallback)
+        SimpleModel.objects.get(pk=pk).tr_title   # fills the cache
+
+        with batch_cache_writes():
+            x = SimpleModel.objects.get(pk=pk)
+            x.tr_title = 'TITLE_CHANGED'
+            x.save()
+            self.assertEqual(cache.get(key)[1], 'TITLE_0')   # not sent yet
+            self.assertEqual(SimpleModel.objects.get(pk=pk).tr_title, 'TITLE_CHANGED')   # but visible in this thread.
+
+        self.assertEqual(cache.get(key)[1], 'TITLE_CHANGED')
+
+        try:
+            with batch_cache_writes():
+                x = SimpleModel.objects.get(pk=pk)
+                x.tr_title = 'TITLE_ROLLBACK'
+                x.save()
+                raise ValueError("rollback")
+        except ValueError:
+            pass
+
+        self.assertIsNone(cache.get(key))
+
+        # A queue left over from a request without response is not sent by the next request.
+        middleware = BatchCacheWritesMiddleware()
+        middleware.process_request(None)
+        x = SimpleModel.objects.get(pk=pk)
+        x.tr_title = 'TITLE_LEFTOVER'
+        x.save()
+        middleware.process_request(None)
+        middleware.process_response(None, None)
+        self.assertIsNone(cache.get(key))
+
+
+    def test_write_behind(self):
+        """
+        Test whether the background threads fill the cache after a read miss.
+        """
+        threads = appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS
+        queue_size = appsettings.PARLER_CACHE_WRITE_BEHIND_QUEUE_SIZE
+        appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS = 1
+        try:
+            pk = SimpleModel.objects.all()[0].pk
+            key = get_translation_cache_key(SimpleModel._translations_model, pk, self.conf_fallback)
+            cache.clear()
+
+            self.assertEqual(SimpleModel.objects.get(pk=pk).tr_title, 'TITLE_0')
+            flush_write_behind()
+            self.assertEqual(cache.get(key)[1], 'TITLE_0')
+            self.assertEqual(get_write_behind_stats()['queued'], 0)
+
+            # Threads which no longer run (e.g. after a fork) are replaced.
+            from parler import cache as parler_cache
+            dead = threading.Thread(target=lambda: None)
+            dead.start()
+            dead.join()
+            parler_cache._write_behind._threads = [dead]
+            cache.clear()
+            SimpleModel.objects.get(pk=pk).tr_title
+            self.assertNotIn(dead, parler_cache._write_behind._threads)
+            self.assertTrue(all(thread.is_alive() for thread in parler_cache._write_behind._threads))
+            flush_write_behind()
+            self.assertEqual(cache.get(key)[1], 'TITLE_0')
+
+            # Entries are dropped when the queue is full.
+            appsettings.PARLER_CACHE_WRITE_BEHIND_QUEUE_SIZE = 0
+            dropped = get_write_behind_stats()['dropped']
+            cache.clear()
+            SimpleModel.objects.get(pk=pk).tr_title
+            flush_write_behind()
+            self.assertIsNone(cache.get(key))
+            self.assertEqual(get_write_behind_stats()['dropped'], dropped + 1)
+        finally:
+            appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS = threads
+            appsettings.PARLER_CACHE_WRITE_BEHIND_QUEUE_SIZE = queue_size
+
+
+    def test_write_behind_save(self):
+        """
+        Test whether a save is not overwritten by an older value which a background thread is still writing.
+        """
+        from parler import cache as parler_cache
+
+        class BlockingCache(object):
+            def __init__(self):
+                self.started = threading.Event()
+                self.release = threading.Event()
+            def set_many(self, *args, **kwargs):
+                if threading.current_thread().name == 'parler-write-behind':
+                    self.started.set()
+                    self.release.wait(5)
+                return cache.set_many(*args, **kwargs)
+            def __getattr__(self, name):
+                return getattr(cache, name)
+
+        threads = appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS
+        latency_budget = appsettings.PARLER_CACHE_LATENCY_BUDGET
+        appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS = 1
+        try:
+            pk = SimpleModel.objects.all()[0].pk
+            key = get_translation_cache_key(SimpleModel._translations_model, pk, self.conf_fallback)
+            for title, waits in (('TITLE_WAITED', True), ('TITLE_STALE', False)):
+                # Either the save waits much longer than the write takes, or it doesn't wait at all.
+                appsettings.PARLER_CACHE_LATENCY_BUDGET = 60 if waits else 0
+                parler_cache.cache = blocking = BlockingCache()
+                cache.clear()
+                SimpleModel.objects.get(pk=pk).tr_title   # the old value is written in the background.
+                blocking.started.wait(5)   # returns None on Python 2.6
+                self.assertTrue(blocking.started.is_set())
+
+                if waits:
+                    # The save waits until the background write is done.
+                    threading.Thread(target=blocking.release.set).start()
+
+                x = SimpleModel.objects.get(pk=pk)
+                x.tr_title = title
+                x.save()
+                blocking.release.set()
+                flush_write_behind()
+
+                values = cache.get(key)
+                if waits:
+                    self.assertEqual(values[1], title)
+                else:
+                    self.assertIsNone(values)   # the stale value is removed after writing.
+                self.assertEqual(SimpleModel.objects.get(pk=pk).tr_title, title)
+        finally:
+            parler_cache.cache = cache
+            appsettings.PARLER_CACHE_WRITE_BEHIND_THREADS = threads
+            appsettings.PARLER_CACHE_LATENCY_BUDGET = latency_budget
+
+
+    def test_circuit_breaker(self):
+        """
+        Test whether a failing cache backend is skipped for a while.
+        """
+        from parler import cache as parler_cache
+
+        class FailingCache(object):
+            calls = 0
+            def __getattr__(self, name):
+                def _fail(*args, **kwargs):
+                    FailingCache.calls += 1
+                    raise IOError("Cache backend is down")
+                return _fail
+
+        old_threshold = appsettings.PARLER_CACHE_BREAKER_THRESHOLD
+        old_max_entries = appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES
+        appsettings.PARLER_CACHE_BREAKER_THRESHOLD = 2
+        parler_cache.cache = FailingCache()
+        try:
+            pk = SimpleModel.objects.all()[0].pk
+            for i in range(3):
+                self.assertEqual(SimpleModel.objects.get(pk=pk).tr_title, 'TITLE_0')
+
+            state = get_cache_breaker_state()
+            self.assertEqual(state['state'], 'open')
+            self.assertEqual(FailingCache.calls, 2)   # skipped after the threshold.
+
+            # After the cool-down period, the backend is probed again.
+            parler_cache.cache = cache
+            parler_cache._breaker._open_until = time.time() - 1
+            self.assertEqual(SimpleModel.objects.get(pk=pk).tr_title, 'TITLE_0')
+            self.assertEqual(get_cache_breaker_state()['state'], 'closed')
+
+            # Saving and invalidating don't fail either.
+            appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES = 100
+            parler_cache.cache = FailingCache()
+            x = SimpleModel.objects.get(pk=pk)
+            x.tr_title = 'TITLE_CHANGED'
+            x.save()
+            bump_cache_generation(SimpleModel)
+            self.assertEqual(get_cache_breaker_state()['state'], 'open')
+        finally:
+            parler_cache.cache = cache
+            parler_cache._breaker = CircuitBreaker()
+            appsettings.PARLER_CACHE_BREAKER_THRESHOLD = old_threshold
+            appsettings.PARLER_LOCAL_CACHE_MAX_ENTRIES = old_max_entries
+            _local_cache.clear()
+
+
+    def test_cached_get(self):
+        """
+        Test whether cached_get() reads the object and translations from a single cache entry.
+        """
+        pk = SimpleModel.objects.all()[0].pk
+        cache.clear()
+
+        with self.assertNumQueries(2):
+            x = SimpleModel.objects.cached_get(pk, self.conf_fallback)
+        self.assertEqual(x.tr_title, 'TITLE_0')
+
+        with self.assertNumQueries(0):
+            x = SimpleModel.objects.cached_get(pk, self.conf_fallback)
+        self.assertEqual(x.tr_title, 'TITLE_0')
+        self.assertEqual(x.get_current_language(), self.conf_fallback)
+        self.assertFalse(x._state.adding)
+
+        # Other languages are added to the entry, so alternating languages don't replace each other.
+        with self.assertNumQueries(2):
+            SimpleModel.objects.cached_get(pk, 'nl')
+        with self.assertNumQueries(2):
+            SimpleModel.objects.cached_get(pk, 'de')
+        with self.assertNumQueries(0):
+            for language_code in ('nl', 'de', 'nl', self.conf_fallback):
+                x = SimpleModel.objects.cached_get(pk, language_code)
+                self.assertEqual(x.get_current_language(), language_code)
+                self.assertEqual(x.tr_title, 'TITLE_0')
+
+        # Saving the shared fields removes the entry, the translation is still cached.
+        x.shared = 'SHARED'
+        x.save()
+        with self.assertNumQueries(1):
+            x = SimpleModel.objects.cached_get(pk, self.conf_fallback)
+        self.assertEqual(x.shared, 'SHARED')
+
+        # Saving a translation removes the entry too.
+        x.tr_title = 'TITLE_NEW'
+        x.save_translations()
+        with self.assertNumQueries(1):
+            x = SimpleModel.objects.cached_get(pk, self.conf_fallback)
+        self.assertEqual(x.tr_title, 'TITLE_NEW')
+
+        # Managers which exclude the object don't use the entry.
+        class OtherSharedManager(TranslatableManager):
+            def get_query_set(self):
+                return super(OtherSharedManager, self).get_query_set().exclude(shared='SHARED')
+
+        manager = OtherSharedManager()
+        manager.model = SimpleModel
+        self.assertRaises(SimpleModel.DoesNotExist, manager.cached_get, pk, self.conf_fallback)
+
+        # A filter on the current time uses the same entry on each call.
+        class PublishedManager(TranslatableManager):
+            def get_query_set(self):
+                return super(PublishedManager, self).get_query_set().extra(where=['%s IS NOT NULL'], params=[datetime.datetime.now()])
+
+        manager = PublishedManager()
+        manager.model = SimpleModel
+        manager.cached_get(pk, self.conf_fallback)
+        with self.assertNumQueries(0):
+            manager.cached_get(pk, self.conf_fallback)
+
+
+    def test_annotate_translations(self):
+        """
+        Test whether the translated fields can be fetched as values, with fallback.
+        """
+        x = SimpleModel.objects.order_by('pk')[1]
+        x.set_current_language('xx')
+        x.tr_title = 'TITLE_XX'
+        x.save_translations()
+
+        with self.assertNumQueries(1):
+            qs = SimpleModel.objects.language('xx').annotate_translations('tr_title')
+            self.assertEqual(list(qs.order_by('pk').values_list('tr_title', flat=True)), ['TITLE_0', 'TITLE_XX', 'TITLE_2'])
+
+        with self.assertNumQueries(1):
+            qs = SimpleModel.objects.annotate_translations('tr_title', language_code='xx').order_by('-tr_title')
+            self.assertEqual([row['tr_title'] for row in qs.values('pk', 'tr_title')], ['TITLE_XX', 'TITLE_2', 'TITLE_0'])
+
+        # Model instances are not affected by the annotations.
+        objects = list(SimpleModel.objects.annotate_translations('tr_title', language_code='xx').order_by('-tr_title'))
+        self.assertEqual(objects[0].pk, x.pk)
+        self.assertEqual(objects[0]._translations_cache, {})
+
+
+    def test_translated_values(self):
+        """
+        Test whether translated values are read without constructing model objects.
+        """
+        from parler.signals import pre_translation_init
+        created = []
+        def _on_init(sender, **kwargs):
+            created.append(sender)
+        pre_translation_init.connect(_on_init)
+        old_chunk_size = appsettings.PARLER_VALUES_CHUNK_SIZE
+        try:
+            with self.assertNumQueries(1):
+                rows = list(SimpleModel.objects.order_by('pk').translated_values_list('id', 'tr_title', language_code='xx'))
+                self.assertEqual([title for id, title in rows], ['TITLE_0', 'TITLE_1', 'TITLE_2'])
+
+            with self.assertNumQueries(1):
+                rows = list(SimpleModel.objects.order_by('pk').translated_values('shared', 'tr_title', language_code='xx', fallback=False))
+                self.assertEqual(rows[0], {'shared': '', 'tr_title': None})
+
+            row = SimpleModel.objects.order_by('pk').translated_values_list(language_code=self.conf_fallback).next()
+            self.assertEqual(row[1:], ('', 'TITLE_0'))
+            self.assertEqual(created, [])
+
+            # Without an ordering, the rows are read in chunks.
+            appsettings.PARLER_VALUES_CHUNK_SIZE = 2
+            with self.assertNumQueries(2):
+                rows = list(SimpleModel.objects.translated_values_list('tr_title', language_code='xx'))
+            self.assertEqual(rows, [('TITLE_0',), ('TITLE_1',), ('TITLE_2',)])
+
+            with self.assertNumQueries(2):
+                rows = list(SimpleModel.objects.translated_values('tr_title', language_code='xx'))
+            self.assertEqual(rows[2], {'tr_title': 'TITLE_2'})
+        finally:
+            appsettings.PARLER_VALUES_CHUNK_SIZE = old_chunk_size
+            pre_translation_init.disconnect(_on_init)
+
+
+    def test_order_by_translated(self):
+        """
+        Test whether objects are ordered by the translated value, without duplicates.
+        """
+        x = SimpleModel.objects.order_by('pk')[0]
+        x.set_current_language('xx')
+        x.tr_title = 'TITLE_9'
+        x.save_translations()
+
+        with self.assertNumQueries(2):
+            titles = [obj.tr_title for obj in SimpleModel.objects.language('xx').prefetch_translations().order_by_translated('-tr_title')]
+        self.assertEqual(titles, ['TITLE_9', 'TITLE_2', 'TITLE_1'])
+
+        qs = SimpleModel.objects.order_by_translated('tr_title', 'pk', language_code=self.conf_fallback)
+        self.assertEqual([obj.pk for obj in qs], list(SimpleModel.objects.order_by('pk').values_list('pk', flat=True)))
+        self.assertEqual(qs.count(), 3)
+
+        # The ordering column is not returned.
+        pks = list(SimpleModel.objects.order_by('pk').values_list('pk', flat=True))
+        self.assertEqual(list(qs.values('pk')), [{'pk': pk} for pk in pks])
+        self.assertEqual(list(qs.values_list('pk', flat=True)), pks)
+        self.assertEqual(sorted(qs.values()[0]), ['id', 'shared'])
+        self.assertEqual(len(qs.values_list()[0]), 2)
+        self.assertFalse([name for name in qs[0].__dict__ if name.startswith('_parler_')])
+
+        # It can be used as subquery, and distinct() isn't affected by the ordering column.
+        self.assertEqual(SimpleModel.objects.filter(pk__in=SimpleModel.objects.order_by_translated('tr_title').values('pk')).count(), 3)
+        self.assertEqual(SimpleModel.objects.filter(pk__in=SimpleModel.objects.order_by_translated('tr_title').values_list('pk', flat=True)).count(), 3)
+        # A sliced subquery keeps its ordering.
+        last_pks = sorted(pks[-2:])
+        subquery = SimpleModel.objects.order_by('-pk').values('pk')[:2]
+        self.assertEqual(sorted(SimpleModel.objects.filter(pk__in=subquery).values_list('pk', flat=True)), last_pks)
+        subquery = SimpleModel.objects.order_by_translated('-tr_title', language_code=self.conf_fallback).values_list('pk', flat=True)[:2]
+        self.assertEqual(sorted(SimpleModel.objects.filter(pk__in=subquery).values_list('pk', flat=True)), last_pks)
+
+        # distinct() would compare the hidden ordering value too, which breaks slicing.
+        self.assertRaises(NotImplementedError, lambda: qs.values('shared').distinct())
+        self.assertRaises(NotImplementedError, lambda: list(qs.distinct().values_list('shared', flat=True)[:2]))
+        qs = SimpleModel.objects.annotate_translations('tr_title', language_code=self.conf_fallback).order_by('tr_title')
+        self.assertEqual(list(qs.values_list('shared', 'tr_title').distinct()[:2]), [('', 'TITLE_0'), ('', 'TITLE_1')])
+
+
+    def test_translated_languages(self):
+        """
+        Test whether objects translated in several languages are returned only once.
+        """
+        x = SimpleModel.objects.order_by('pk')[0]
+        x.set_current_language('xx')
+        x.tr_title = 'TITLE_XX'
+        x.save_translations()
+
+        qs = SimpleModel.objects.translated(self.conf_fallback, 'xx')
+        self.assertNotIn('DISTINCT', str(qs.query))
+        self.assertEqual(qs.count(), 3)
+        self.assertEqual(sorted(obj.pk for obj in qs), sorted(SimpleModel.objects.values_list('pk', flat=True)))
+        self.assertEqual(list(SimpleModel.objects.translated('xx', 'yy')), [x])
@@ -43,4 +43,47 @@ class EmptyModel(TranslatableModel):
     translations = TranslatedFields()
 
     def __unicode__(self):
-        return self.shared
\ No newline at end of file
+        return self.shared
+
+
+class CategoryModel(TranslatableModel):
+    parent = models.ForeignKey('self', null=True, blank=True)
+
+    translations = TranslatedFields(
+        tr_title = models.CharField(max_length=200)
+    )
+
+    def __unicode__(self):
+        return self.tr_title
+
+
+class TagModel(TranslatableModel):
+    translations = TranslatedFields(
+        tr_title = models.CharField(max_length=200)
+    )
+
+    def __unicode__(self):
+        return self.tr_title
+
+
+class ProductModel(TranslatableModel):
+    category = models.ForeignKey(CategoryModel, null=True, blank=True)
+    tags = models.ManyToManyField(TagModel, blank=True)
+
+    translations = TranslatedFields(
+        tr_title = models.CharField(max_length=200)
+    )
+
+    def __unicode__(self):
+        return self.tr_title
+
+
+class ArticleModel(TranslatableModel):
+    translations = TranslatedFields(
+        heavy_fields=('tr_content',),
+        tr_title = models.CharField(max_length=200),
+        tr_content = models.TextField(blank=True),
+    )
+
+    def __unicode__(self):
+        return self.tr_title
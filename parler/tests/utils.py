@@ -2,6 +2,7 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.management import call_command
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.db.models import loading
 from django.template.loaders import app_directories
 from django.test import TestCase
@@ -44,3 +45,9 @@ class AppTestCase(TestCase):
         # 1.4 does not create site automatically with the defined SITE_ID, 1.3 does.
         Site.objects.get_or_create(id=settings.SITE_ID, defaults=dict(domain='django.localhost', name='django at localhost'))
         cls.user, _ = User.objects.get_or_create(is_superuser=True, is_staff=True, username="admin")
+
+
+    def setUp(self):
+        super(AppTestCase, self).setUp()
+        # The database is rolled back after each test, so the cached translations are no longer valid.
+        cache.clear()
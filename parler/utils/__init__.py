@@ -1,10 +1,13 @@
 from .i18n import *
+from .prefetch import prefetch_translations
 
 __all__ = (
     'normalize_language_code',
     'is_supported_django_language',
     'get_language_title',
     'get_language_settings',
+    'get_fallback_languages',
     'get_active_language_choices',
     'is_multilingual_project',
+    'prefetch_translations',
 )
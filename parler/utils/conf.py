@@ -30,13 +30,21 @@ class LanguagesSetting(dict):
         """
         Find out which translations should be visible in the site.
         It returns a tuple with either a single choice (the current language),
-        or a tuple with the current language + fallback language.
+        or a tuple with the current language + fallback languages.
         """
         if language_code is None:
             language_code = get_language()
 
-        lang_dict = self.get_language(language_code)
-        if not lang_dict['hide_untranslated'] and lang_dict['fallback'] != language_code:
-            return (language_code, lang_dict['fallback'])
+        if not self.get_language(language_code)['hide_untranslated']:
+            return (language_code,) + tuple(self.get_fallback_languages(language_code))
         else:
             return (language_code,)
+
+
+    def get_fallback_languages(self, language_code, site_id=None):
+        """
+        Return the chain of fallback languages, in the order in which they should be tried.
+        The language itself is not included.
+        """
+        lang_dict = self.get_language(language_code, site_id)
+        return [code for code in lang_dict['fallbacks'] if code != language_code]
@@ -44,11 +44,19 @@ def get_language_settings(language_code, site_id=None):
     return appsettings.PARLER_LANGUAGES.get_language(language_code, site_id)
 
 
+def get_fallback_languages(language_code, site_id=None):
+    """
+    Return the chain of fallback languages for a language code.
+    """
+    from parler import appsettings
+    return appsettings.PARLER_LANGUAGES.get_fallback_languages(language_code, site_id)
+
+
 def get_active_language_choices(language_code=None):
     """
     Find out which translations should be visible in the site.
     It returns a tuple with either a single choice (the current language),
-    or a tuple with the current language + fallback language.
+    or a tuple with the current language + fallback languages.
     """
     from parler import appsettings
     return appsettings.PARLER_LANGUAGES.get_active_choices(language_code)
@@ -0,0 +1,111 @@
+"""
+Fetching translations for multiple objects at once.
+"""
+from .i18n import normalize_language_code
+
+
+def prefetch_translations(objects, language_codes=None):
+    """
+    Fill the translations cache of the given objects,
+    using a single cache query and database query per translations model.
+
+    The objects may be of different model types, e.g. the result of a search or django-polymorphic query.
+    When no language codes are given, the current language and fallback languages of each object are fetched.
+    Languages that are not found are stored as missing marker in the cache,
+    so the objects won't query the database for them again.
+    """
+    from parler.cache import get_cached_translations, _refill_lock
+    if language_codes:
+        language_codes = [normalize_language_code(code) for code in language_codes]
+
+    # Group the objects per translations model and database,
+    # as each combination needs a separate query.
+    groups = {}
+    for obj in objects:
+        if obj.pk is None:
+            continue
+
+        codes = language_codes or [obj.get_current_language()] + obj.get_fallback_languages()
+        missing = set(code for code in codes if code and code not in obj._translations_cache)
+        if missing:
+            key = (obj._translations_model, obj._state.db)
+            groups.setdefault(key, {}).setdefault(obj.pk, []).append((obj, missing))
+
+    for (translations_model, using), masters in groups.iteritems():
+        # 1. fetch from memcache
+        pending = []
+        for entries in masters.itervalues():
+            requested = {}
+            for obj, missing in entries:
+                for code in missing:
+                    requested.setdefault(code, obj)
+            pending.extend((obj, code) for code, obj in requested.iteritems())
+
+        for translation in get_cached_translations(pending):
+            _assign_translation(masters[translation.master_id], translation)
+
+        # 2. fetch the remaining languages from the database
+        queried = [(obj, code) for obj, code in pending if code not in obj._translations_cache]
+        if queried and len(masters) == 1:
+            # A single object (e.g. reading an attribute of a popular page) is protected against cache stampedes.
+            with _refill_lock(translations_model, queried[0][0].pk) as owner:
+                if not owner:
+                    for translation in get_cached_translations(queried):
+                        _assign_translation(masters[translation.master_id], translation)
+                    queried = [(obj, code) for obj, code in queried if code not in obj._translations_cache]
+
+                _fetch_translations(translations_model, using, masters, queried)
+        elif queried:
+            _fetch_translations(translations_model, using, masters, queried)
+
+        # Explicit marker that the language query was tried before.
+        for entries in masters.itervalues():
+            for obj, missing in entries:
+                for code in missing:
+                    obj._translations_cache.setdefault(code, None)
+
+
+def _fetch_translations(translations_model, using, masters, queried):
+    """
+    Fetch the translations from the database, and store them in the cache.
+    """
+    from parler import appsettings
+    from parler.cache import _cache_translations, _cache_missing_translations, _cache_translation_bundles
+    if not queried:
+        return
+
+    if appsettings.PARLER_CACHE_BUNDLE:
+        # The cache stores all languages in a single entry, so fetch all languages.
+        master_ids = set(obj.pk for obj, _ in queried)
+        translations = list(translations_model.objects.using(using).filter(master__in=master_ids))
+        for translation in translations:
+            _assign_translation(masters[translation.master_id], translation, all_languages=True)
+
+        _cache_translation_bundles(translations_model, master_ids, translations, background=True)  # Store in memcached
+    else:
+        translations = translations_model.objects.using(using).filter(
+            master__in=set(obj.pk for obj, _ in queried),
+            language_code__in=set(code for _, code in queried)
+        )
+        found = []
+        for translation in translations:
+            if _assign_translation(masters[translation.master_id], translation):
+                found.append(translation)
+
+        _cache_translations(found, background=True)  # Store in memcached
+        _cache_missing_translations([(obj, code) for obj, code in queried if code not in obj._translations_cache], background=True)
+
+
+def _assign_translation(entries, translation, all_languages=False):
+    """
+    Store the translation in the cache of all objects that requested the language.
+    """
+    assigned = False
+    for obj, missing in entries:
+        if (all_languages or translation.language_code in missing) and translation.language_code not in obj._translations_cache:
+            if not assigned:
+                translation.master = obj  # avoid a query when accessing the master.
+                assigned = True
+            obj._translations_cache[translation.language_code] = translation
+
+    return assigned